@@ -9,16 +9,24 @@ Each agent focuses on a specific aspect like code quality, architecture, etc.
 import json
 import re
 import os
-import pickle
+import sys
+import functools
+import itertools
+import heapq
+import hashlib
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 import requests
 from pathlib import Path
-from collections import defaultdict, Counter
+from types import MappingProxyType
+from collections import defaultdict, Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import math
+import time
+import threading
 
 # Import UI rendering capabilities
 try:
@@ -28,14 +36,139 @@ except ImportError:
     UI_RENDERING_AVAILABLE = False
     print("Warning: UI rendering capabilities not available. Install selenium, opencv-python, and pillow.")
 
+# orjson is optional - it just makes serializing agent inputs and grading results faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # Some constants we'll use throughout
 DEFAULT_CONFIDENCE = 0.5
 MAX_PATTERNS = 1000
 MIN_SAMPLES_FOR_LEARNING = 3
 
+# Evidence prefixes shared by every per-file evidence string
+_ROUTE_PREFIX = sys.intern("Route file: ")
+_DEPLOYMENT_PREFIX = sys.intern("Deployment file: ")
+_API_ENDPOINT_PREFIX = sys.intern("API endpoint: ")
+_PERFORMANCE_PREFIX = sys.intern("Performance file: ")
+_SECURITY_PREFIX = sys.intern("Security file: ")
+
+
+def _dumps_json(obj: Any) -> str:
+    """Serialize to compact JSON text, non-ASCII kept as-is, with orjson when it's installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+def _dumps_json_indented(obj: Any) -> str:
+    """Serialize to 2-space indented JSON text, non-ASCII kept as-is, with orjson when it's installed"""
+    if ORJSON_AVAILABLE:
+        # Agent scores can come through as numpy floats
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _context_fingerprint(context: Dict[str, Any]) -> Optional[str]:
+    """Stable digest of a context's public entries, or None if they can't be serialized"""
+    public = {key: value for key, value in context.items() if not key.startswith('_')}
+    try:
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(public, option=orjson.OPT_SORT_KEYS, default=str)
+        else:
+            data = json.dumps(public, sort_keys=True, default=str, ensure_ascii=False).encode('utf-8')
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _loads_json(raw) -> Any:
+    """Parse JSON text or bytes, with orjson when it's installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _get_readme_lower(context: Dict[str, Any]) -> str:
+    """The context's README lowercased, built once per context and shared by every agent"""
+    cache = context.setdefault('_extractor_cache', {})
+    readme = context.get('readme', '')
+    
+    entry = cache.get('readme_lower')
+    if entry is None or entry[0] is not readme:
+        entry = cache['readme_lower'] = (readme, readme.lower() if readme else '')
+    return entry[1]
+
+
+@functools.lru_cache(maxsize=4096)
+def _make_evidence(prefix: str, path: str) -> str:
+    """Build a per-file evidence string, sharing one copy per (prefix, path) across agents"""
+    return prefix + path
+
+
+def _trie_pattern(words) -> str:
+    """Build a regex alternation for literal words with shared prefixes factored out"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}  # end-of-word marker
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A word ending here makes the longer continuations optional (greedy, so longest wins)
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+def _compile_keywords(keywords, flags: int = 0) -> re.Pattern:
+    """Compile literal keywords into a single-pass, trie-shaped scanner.
+
+    findall() on the result yields every keyword occurring anywhere in the text,
+    overlapping occurrences included. Where one keyword is a prefix of another, only
+    the longer one is reported at a position where both match.
+    """
+    return re.compile(f'(?=({_trie_pattern(keywords)}))', flags)
+
+
+@functools.lru_cache(maxsize=None)
+def _keyword_search(*keywords: str):
+    """search() of a compiled regex matching any of the literal keywords, built once per keyword set"""
+    return re.compile(_trie_pattern(keywords)).search
+
+
+class _LRUCache:
+    """Small thread-safe LRU map for an agent's own results - no logging, no stats"""
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key) -> Optional[Any]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
 
-@dataclass
+
+@dataclass(slots=True)
 class AgentAnalysis:
     """Container for agent analysis results - keeps things organized"""
     agent_name: str
@@ -45,18 +178,141 @@ class AgentAnalysis:
     recommendations: List[str]
     insights: List[str]
     risks: List[str]
+    
+    def copy(self) -> 'AgentAnalysis':
+        """A copy with its own lists, so changing one doesn't change the other"""
+        return AgentAnalysis(self.agent_name, self.score, self.confidence, list(self.evidence),
+                             list(self.recommendations), list(self.insights), list(self.risks))
+
+
+_EXCEPT_SEARCH = re.compile(r'except\s').search
+
+
+def _has_try_except(code_content: str) -> bool:
+    """Whether an `except` follows a `try:` anywhere in the code.
+
+    Only the first `try:` matters - it leaves the most room for an `except` - so
+    this is one find() and one scan, where a `try:.*?except` regex rescans the
+    rest of the file for every `try:` when no `except` follows.
+    """
+    start = code_content.find('try:')
+    return start != -1 and _EXCEPT_SEARCH(code_content, start + 4) is not None
+
+
+# Code patterns looked for by BaseAIAgent.extract_code_patterns: (search, category, label).
+# The multi-line patterns are lazy so a search stops at the first closing match instead
+# of running to the end of the file and backtracking.
+_CODE_PATTERN_CHECKS = (
+    # Good patterns
+    (re.compile(r'async\s+def|await\s+').search, 'good_patterns', 'Async/await usage'),
+    (_has_try_except, 'good_patterns', 'Error handling'),
+    (re.compile(r'def\s+\w+\([^)]*\):\s*""".*?"""', re.DOTALL).search, 'good_patterns', 'Function documentation'),
+    # Bad patterns
+    (re.compile(r'print\s*\(').search, 'bad_patterns', 'Debug print statements'),
+    (re.compile(r'password\s*=\s*["\'][^"\']+["\']', re.IGNORECASE).search, 'security_concerns', 'Hardcoded passwords'),
+    (re.compile(r'eval\s*\(').search, 'security_concerns', 'Use of eval() function'),
+    (re.compile(r'for\s+\w+\s+in\s+range\s*\(\s*len\s*\(').search, 'performance_issues', 'Inefficient loop patterns'),
+)
+
+
+class FileTreeColumns:
+    """A file tree as parallel columns, one entry per file tree item.
+
+    The core agents read paths, types and lowercased paths far more often than
+    whole entries, so the columns are pulled out of the entry dicts once and the
+    helpers zip over plain lists instead of doing dict lookups per access.
+    """
+    
+    def __init__(self, file_tree: List[Dict[str, Any]]):
+        self.paths = [file_info.get('path', '') for file_info in file_tree]
+        self.types = [file_info.get('type') for file_info in file_tree]
+        self.paths_lower = [path.lower() for path in self.paths]
+        self.basenames = [path[path.rfind('/') + 1:] for path in self.paths]
+    
+    def first_path(self, predicate, column: List[str]) -> Optional[str]:
+        """Path of the first entry whose value in column satisfies predicate, if any"""
+        for path, value in zip(self.paths, column):
+            if predicate(value):
+                return path
+        return None
+    
+    @functools.cached_property
+    def lower_blob(self) -> str:
+        """All lowercased paths NUL-joined, so one regex search covers the whole tree"""
+        return '\0'.join(self.paths_lower)
+    
+    def first_lower_match(self, search) -> Optional[str]:
+        """Path of the first entry whose lowercased path search() matches, if any.
+
+        Paths can't contain NUL, so a keyword match in lower_blob never spans two
+        entries and the NULs before it give the entry's index.
+        """
+        match = search(self.lower_blob)
+        if match is None:
+            return None
+        return self.paths[self.lower_blob.count('\0', 0, match.start())]
+
+
+def _get_file_columns(context: Dict[str, Any]) -> FileTreeColumns:
+    """The context's file tree as columns, built once per context and shared by every agent"""
+    cache = context.setdefault('_extractor_cache', {})
+    file_tree = context.get('file_tree', [])
+    
+    entry = cache.get('file_tree_columns')
+    if entry is None or entry[0] is not file_tree:
+        entry = cache['file_tree_columns'] = (file_tree, FileTreeColumns(file_tree))
+    return entry[1]
+
+
+def _get_inputs_digest(context: Dict[str, Any], keys: Tuple[str, ...]) -> Optional[str]:
+    """Fingerprint of the context's values for keys, computed once per context and shared by every agent
+
+    Like the other per-context caches this checks identity, not contents - the
+    values are expected to be replaced, not edited in place, between analyses.
+    """
+    cache = context.setdefault('_extractor_cache', {})
+    inputs = tuple(context.get(key) for key in keys)
+    
+    entry = cache.get(('inputs_digest', keys))
+    if entry is None or any(old is not new for old, new in zip(entry[0], inputs)):
+        entry = cache[('inputs_digest', keys)] = (inputs, _context_fingerprint(dict(zip(keys, inputs))))
+    return entry[1]
 
 
 class BaseAIAgent(ABC):
     """Base class for all our AI agents - keeps the interface consistent"""
     
+    # Context keys the analysis depends on - results are reused while these are unchanged.
+    # None means the agent has to run every time.
+    _cache_inputs: Optional[Tuple[str, ...]] = ('file_tree', 'readme', 'artifacts')
+    
     def __init__(self, name: str, api_key: Optional[str] = None):
         self.name = name
         self.api_key = api_key
         self.analysis_history = []  # Keep track of what we've analyzed
+        self._analysis_cache = _LRUCache(max_size=32)
     
-    @abstractmethod
     def analyze(self, context: Dict[str, Any]) -> AgentAnalysis:
+        """Analyze the submission, reusing the result if we've already seen the same inputs"""
+        key = self._analysis_key(context)
+        if key is None:
+            return self._analyze_impl(context)
+        
+        result = self._analysis_cache.get(key)
+        if result is None:
+            result = self._analyze_impl(context)
+            self._analysis_cache.set(key, result)
+        # Hand out a copy - callers are free to edit the lists without touching the cached result
+        return result.copy()
+    
+    def _analysis_key(self, context: Dict[str, Any]) -> Optional[str]:
+        """Cache key for the context's analysis inputs, or None if the result can't be reused"""
+        if self._cache_inputs is None:
+            return None
+        return _get_inputs_digest(context, self._cache_inputs)
+    
+    @abstractmethod
+    def _analyze_impl(self, context: Dict[str, Any]) -> AgentAnalysis:
         """Each agent needs to implement this - the main analysis method"""
         pass
     
@@ -66,12 +322,17 @@ class BaseAIAgent(ABC):
             return 0.0  # No evidence = no confidence
         
         # More evidence = more confidence (up to a point)
-        base_confidence = min(evidence_count / 10.0, 1.0)
+        base_confidence = evidence_count / 10.0
+        if base_confidence > 1.0:
+            base_confidence = 1.0
         
         # Quality indicators give us a little boost
-        quality_boost = min(quality_indicators / 5.0, 0.3)
+        quality_boost = quality_indicators / 5.0
+        if quality_boost > 0.3:
+            quality_boost = 0.3
         
-        return min(base_confidence + quality_boost, 1.0)
+        confidence = base_confidence + quality_boost
+        return confidence if confidence < 1.0 else 1.0
     
     def extract_code_patterns(self, code_content: str) -> Dict[str, List[str]]:
         """Extract common code patterns and anti-patterns"""
@@ -82,28 +343,9 @@ class BaseAIAgent(ABC):
             'performance_issues': []
         }
         
-        # Good patterns
-        if re.search(r'async\s+def|await\s+', code_content):
-            patterns['good_patterns'].append('Async/await usage')
-        
-        if re.search(r'try:\s*.*except\s+', code_content, re.DOTALL):
-            patterns['good_patterns'].append('Error handling')
-        
-        if re.search(r'def\s+\w+\([^)]*\):\s*""".*"""', code_content, re.DOTALL):
-            patterns['good_patterns'].append('Function documentation')
-        
-        # Bad patterns
-        if re.search(r'print\s*\(', code_content):
-            patterns['bad_patterns'].append('Debug print statements')
-        
-        if re.search(r'password\s*=\s*["\'][^"\']+["\']', code_content, re.IGNORECASE):
-            patterns['security_concerns'].append('Hardcoded passwords')
-        
-        if re.search(r'eval\s*\(', code_content):
-            patterns['security_concerns'].append('Use of eval() function')
-        
-        if re.search(r'for\s+\w+\s+in\s+range\s*\(\s*len\s*\(', code_content):
-            patterns['performance_issues'].append('Inefficient loop patterns')
+        for search, category, label in _CODE_PATTERN_CHECKS:
+            if search(code_content):
+                patterns[category].append(label)
         
         return patterns
 
@@ -114,9 +356,9 @@ class CodeAnalysisAgent(BaseAIAgent):
     def __init__(self, api_key: Optional[str] = None):
         super().__init__("CodeAnalysisAgent", api_key)
     
-    def analyze(self, context: Dict[str, Any]) -> AgentAnalysis:
+    def _analyze_impl(self, context: Dict[str, Any]) -> AgentAnalysis:
         """Analyze code quality, patterns, and best practices"""
-        file_tree = context.get('file_tree', [])
+        files = _get_file_columns(context)
         readme = context.get('readme', '')
         artifacts = context.get('artifacts', {})
         
@@ -127,7 +369,7 @@ class CodeAnalysisAgent(BaseAIAgent):
         score = 0
         
         # Analyze code files
-        code_files = self._get_code_files(file_tree)
+        code_files = self._get_code_files(files)
         evidence.append(f"Found {len(code_files)} code files")
         
         if code_files:
@@ -177,13 +419,13 @@ class CodeAnalysisAgent(BaseAIAgent):
             ])
         
         # Test analysis
-        test_analysis = self._analyze_tests(file_tree, artifacts)
+        test_analysis = self._analyze_tests(files, artifacts)
         score += test_analysis['score']
         evidence.extend(test_analysis['evidence'])
         recommendations.extend(test_analysis['recommendations'])
         
         # Documentation analysis
-        doc_analysis = self._analyze_documentation(readme, file_tree)
+        doc_analysis = self._analyze_documentation(readme, files)
         score += doc_analysis['score']
         evidence.extend(doc_analysis['evidence'])
         
@@ -210,18 +452,13 @@ class CodeAnalysisAgent(BaseAIAgent):
             risks=risks
         )
     
-    def _get_code_files(self, file_tree: List[Dict[str, Any]]) -> List[str]:
+    def _get_code_files(self, files: FileTreeColumns) -> List[str]:
         """Extract code files from file tree"""
-        code_extensions = ['.py', '.js', '.ts', '.java', '.go', '.rs', '.cpp', '.c', '.php', '.rb', '.swift', '.kt']
-        code_files = []
-        
-        for file_info in file_tree:
-            if file_info.get('type') == 'blob':
-                file_path = file_info.get('path', '')
-                if any(file_path.endswith(ext) for ext in code_extensions):
-                    code_files.append(file_path)
-        
-        return code_files
+        # Every extension has a single leading dot, so matching from the last dot is an endswith test
+        return [
+            file_path for file_path, file_type in zip(files.paths, files.types)
+            if file_type == 'blob' and file_path[file_path.rfind('.'):] in _CODE_EXTS
+        ]
     
     def _analyze_code_patterns(self, code_files: List[str], artifacts: Dict[str, Any]) -> Dict[str, List[str]]:
         """Comprehensive code pattern analysis following evaluation parameters"""
@@ -241,11 +478,11 @@ class CodeAnalysisAgent(BaseAIAgent):
             file_name = file_path.lower()
             
             # Code Quality & Readability Analysis
-            if self._check_naming_conventions(file_path):
+            if self._check_naming_conventions(file_name):
                 patterns['naming_conventions'].append('Consistent naming conventions detected')
                 patterns['good_patterns'].append('Proper naming conventions')
             
-            if self._check_code_organization(file_path):
+            if self._check_code_organization(file_name):
                 patterns['code_quality'].append('Well-organized code structure')
                 patterns['good_patterns'].append('Good code organization')
             
@@ -267,12 +504,12 @@ class CodeAnalysisAgent(BaseAIAgent):
                 patterns['code_quality'].append('Clear data abstraction')
             
             # Algorithmic Efficiency Analysis
-            if self._check_algorithmic_efficiency(file_path):
+            if self._check_algorithmic_efficiency(file_name):
                 patterns['algorithmic_efficiency'].append('Efficient data structures detected')
                 patterns['good_patterns'].append('Optimized algorithms')
             
             # Scalability & Maintainability Analysis
-            if self._check_maintainability(file_path):
+            if self._check_maintainability(file_name):
                 patterns['maintainability'].append('Low coupling, high cohesion')
                 patterns['good_patterns'].append('Maintainable code structure')
             
@@ -288,9 +525,9 @@ class CodeAnalysisAgent(BaseAIAgent):
                 patterns['maintainability'].append('Maintainability issue: outdated code')
             
             # Security and Performance Analysis
-            if self._check_security_concerns(file_path):
+            if self._check_security_concerns(file_name):
                 patterns['security_concerns'].append('Potential security vulnerability')
-            if self._check_performance_issues(file_path):
+            if self._check_performance_issues(file_name):
                 patterns['performance_issues'].append('Performance bottleneck detected')
         
         # Enhanced lint results analysis
@@ -305,52 +542,52 @@ class CodeAnalysisAgent(BaseAIAgent):
         
         return patterns
     
-    def _check_naming_conventions(self, file_path: str) -> bool:
+    def _check_naming_conventions(self, file_name: str) -> bool:
         """Check for consistent naming conventions"""
         # Check for consistent naming patterns
-        if any(pattern in file_path.lower() for pattern in ['camelcase', 'snake_case', 'kebab-case']):
+        if _keyword_search('camelcase', 'snake_case', 'kebab-case')(file_name):
             return True
         # Check for proper file naming
-        if file_path.count('_') > 0 or file_path.count('-') > 0:
+        if file_name.count('_') > 0 or file_name.count('-') > 0:
             return True
         return False
     
-    def _check_code_organization(self, file_path: str) -> bool:
+    def _check_code_organization(self, file_name: str) -> bool:
         """Check for good code organization patterns"""
         # Check for modular structure
-        if any(folder in file_path.lower() for folder in ['src', 'lib', 'app', 'components', 'utils']):
+        if _keyword_search('src', 'lib', 'app', 'components', 'utils')(file_name):
             return True
         return False
     
-    def _check_algorithmic_efficiency(self, file_path: str) -> bool:
+    def _check_algorithmic_efficiency(self, file_name: str) -> bool:
         """Check for algorithmic efficiency indicators"""
         # Check for efficient data structures
-        if any(ds in file_path.lower() for ds in ['hash', 'map', 'set', 'tree', 'graph', 'queue', 'stack']):
+        if _keyword_search('hash', 'map', 'set', 'tree', 'graph', 'queue', 'stack')(file_name):
             return True
         return False
     
-    def _check_maintainability(self, file_path: str) -> bool:
+    def _check_maintainability(self, file_name: str) -> bool:
         """Check for maintainability indicators"""
         # Check for loose coupling indicators
-        if any(pattern in file_path.lower() for pattern in ['interface', 'abstract', 'base', 'contract']):
+        if _keyword_search('interface', 'abstract', 'base', 'contract')(file_name):
             return True
         return False
     
-    def _check_security_concerns(self, file_path: str) -> bool:
+    def _check_security_concerns(self, file_name: str) -> bool:
         """Check for security concerns"""
         # Check for potential security issues
-        if any(concern in file_path.lower() for concern in ['password', 'secret', 'key', 'token']):
+        if _keyword_search('password', 'secret', 'key', 'token')(file_name):
             return True
         return False
     
-    def _check_performance_issues(self, file_path: str) -> bool:
+    def _check_performance_issues(self, file_name: str) -> bool:
         """Check for performance issues"""
         # Check for potential performance bottlenecks
-        if any(issue in file_path.lower() for issue in ['loop', 'recursive', 'nested', 'heavy']):
+        if _keyword_search('loop', 'recursive', 'nested', 'heavy')(file_name):
             return True
         return False
     
-    def _analyze_tests(self, file_tree: List[Dict[str, Any]], artifacts: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_tests(self, files: FileTreeColumns, artifacts: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze test coverage and quality"""
         result = {
             'score': 0,
@@ -358,12 +595,12 @@ class CodeAnalysisAgent(BaseAIAgent):
             'recommendations': []
         }
         
-        # Find test files
-        test_files = [f for f in file_tree if 'test' in f.get('path', '').lower()]
+        # Count test files - only the number is reported, so don't collect them
+        test_file_count = sum(1 for path in files.paths_lower if 'test' in path)
         
-        if test_files:
+        if test_file_count:
             result['score'] += 2
-            result['evidence'].append(f"Test files found: {len(test_files)}")
+            result['evidence'].append(f"Test files found: {test_file_count}")
         
         # Analyze test results
         if artifacts.get('test_results'):
@@ -386,7 +623,7 @@ class CodeAnalysisAgent(BaseAIAgent):
         
         return result
     
-    def _analyze_documentation(self, readme: str, file_tree: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_documentation(self, readme: str, files: FileTreeColumns) -> Dict[str, Any]:
         """Analyze code documentation"""
         result = {
             'score': 0,
@@ -403,8 +640,9 @@ class CodeAnalysisAgent(BaseAIAgent):
                 result['evidence'].append("Code examples in README")
         
         # Check for additional documentation
-        doc_files = [f for f in file_tree if f.get('path', '').endswith(('.md', '.rst'))]
-        if len(doc_files) > 1:  # More than just README
+        # Stop at the second doc file rather than collecting every one
+        doc_files = (path for path in files.paths if path.endswith(('.md', '.rst')))
+        if next(doc_files, None) is not None and next(doc_files, None) is not None:  # More than just README
             result['score'] += 1
             result['evidence'].append("Additional documentation files")
         
@@ -535,15 +773,114 @@ class CodeAnalysisAgent(BaseAIAgent):
         return explanation
 
 
+# Keyword families ArchitectureAgent looks for in lowercased file paths
+_GOOD_TOP_DIRS = frozenset({'src', 'lib', 'app', 'components', 'utils', 'config', 'tests', 'docs'})
+_ARCHITECTURE_PATTERNS = {
+    'mvc': ('controller', 'model', 'view', 'mvc'),
+    'microservices': ('service', 'api', 'gateway', 'microservice'),
+    'layered': ('presentation', 'business', 'data', 'layer'),
+    'component': ('component', 'module', 'widget', 'ui'),
+    'event_driven': ('event', 'listener', 'handler', 'publisher'),
+    'hexagonal': ('port', 'adapter', 'hexagon'),
+    'clean_architecture': ('domain', 'application', 'infrastructure')
+}
+_ARCHITECTURE_LAYERS = {
+    'presentation': ('ui', 'view', 'component', 'page', 'screen'),
+    'business': ('service', 'logic', 'business', 'domain'),
+    'data': ('model', 'entity', 'repository', 'dao', 'database'),
+    'infrastructure': ('config', 'util', 'helper', 'common')
+}
+# Families counted per file: how many paths contain at least one of the keywords
+_ARCHITECTURE_INDICATORS = {
+    'data_flow': ('api', 'endpoint', 'route', 'controller', 'service', 'repository'),
+    'control_flow': ('middleware', 'interceptor', 'filter', 'guard', 'decorator'),
+    'horizontal': ('load_balancer', 'cluster', 'distributed', 'microservice', 'api_gateway'),
+    'vertical': ('optimization', 'performance', 'memory', 'cpu', 'resource'),
+    'caching': ('cache', 'redis', 'memcached', 'session', 'storage'),
+    'async': ('async', 'await', 'promise', 'future', 'callback', 'queue', 'worker'),
+    'load': ('rate_limit', 'throttle', 'circuit_breaker', 'bulkhead', 'timeout'),
+    'architectural': ('controller', 'service', 'model', 'repository', 'component'),
+    'config': ('.env', 'config', 'settings', 'docker'),
+    'security': ('security', 'auth', 'middleware', 'guard', 'jwt'),
+}
+_EXPECTED_COMPONENTS = ('controller', 'service', 'model', 'repository', 'component', 'api')
+
+_ARCHITECTURE_KEYWORDS = sorted(
+    {kw for family in (*_ARCHITECTURE_PATTERNS.values(), *_ARCHITECTURE_LAYERS.values(),
+                       *_ARCHITECTURE_INDICATORS.values(), _EXPECTED_COMPONENTS) for kw in family}
+    | {'dockerfile'}
+)
+_ARCHITECTURE_SCANNER = _compile_keywords(_ARCHITECTURE_KEYWORDS)
+# The scanner reports only the longest keyword at a position, so a hit also stands for
+# every keyword that is a prefix of it ('database' also means 'data')
+_ARCHITECTURE_KEYWORD_PREFIXES = {
+    kw: frozenset(prefix for prefix in _ARCHITECTURE_KEYWORDS if kw.startswith(prefix))
+    for kw in _ARCHITECTURE_KEYWORDS
+}
+
+
+class ArchitectureSignals:
+    """What ArchitectureAgent reads off a file tree, gathered in one pass.
+
+    Each lowercased path is scanned once for every architecture keyword; the
+    families the analysis methods ask about are then set checks on the
+    keywords that path contains.
+    """
+    
+    def __init__(self, files: FileTreeColumns):
+        self.directory_count = 0
+        self.file_count = 0
+        self.top_dirs = set()
+        self.indicator_counts = dict.fromkeys(_ARCHITECTURE_INDICATORS, 0)
+        self.security_file = None  # first security-related path, as given
+        self.has_dockerfile = False
+        self.has_github = False
+        self.has_env_example = False
+        found_keywords = set()
+        
+        for path, path_lower, file_type in zip(files.paths, files.paths_lower, files.types):
+            if file_type == 'tree':
+                self.directory_count += 1
+                dir_name = path.split('/')[0]
+                if dir_name in _GOOD_TOP_DIRS:
+                    self.top_dirs.add(dir_name)
+            elif file_type == 'blob':
+                self.file_count += 1
+            
+            if '.github' in path:
+                self.has_github = True
+            if '.env.example' in path:
+                self.has_env_example = True
+            
+            hits = _ARCHITECTURE_SCANNER.findall(path_lower)
+            if not hits:
+                continue
+            keywords = set().union(*(_ARCHITECTURE_KEYWORD_PREFIXES[hit] for hit in hits))
+            found_keywords |= keywords
+            
+            for family, family_keywords in _ARCHITECTURE_INDICATORS.items():
+                if not keywords.isdisjoint(family_keywords):
+                    self.indicator_counts[family] += 1
+            if self.security_file is None and not keywords.isdisjoint(_ARCHITECTURE_INDICATORS['security']):
+                self.security_file = path
+            if 'dockerfile' in keywords:
+                self.has_dockerfile = True
+        
+        # Families in table order, as the per-family scans reported them
+        self.patterns = [name for name, family in _ARCHITECTURE_PATTERNS.items() if not found_keywords.isdisjoint(family)]
+        self.layers = {name for name, family in _ARCHITECTURE_LAYERS.items() if not found_keywords.isdisjoint(family)}
+        self.components = found_keywords.intersection(_EXPECTED_COMPONENTS)
+
+
 class ArchitectureAgent(BaseAIAgent):
     """AI agent for architecture analysis"""
     
     def __init__(self, api_key: Optional[str] = None):
         super().__init__("ArchitectureAgent", api_key)
     
-    def analyze(self, context: Dict[str, Any]) -> AgentAnalysis:
+    def _analyze_impl(self, context: Dict[str, Any]) -> AgentAnalysis:
         """Analyze architecture and design patterns"""
-        file_tree = context.get('file_tree', [])
+        signals = ArchitectureSignals(_get_file_columns(context))
         readme = context.get('readme', '')
         artifacts = context.get('artifacts', {})
         
@@ -554,31 +891,31 @@ class ArchitectureAgent(BaseAIAgent):
         score = 0
         
         # Analyze project structure
-        structure_analysis = self._analyze_structure(file_tree)
+        structure_analysis = self._analyze_structure(signals)
         score += structure_analysis['score']
         evidence.extend(structure_analysis['evidence'])
         recommendations.extend(structure_analysis['recommendations'])
         
         # Analyze design patterns
-        pattern_analysis = self._analyze_design_patterns(file_tree, readme)
+        pattern_analysis = self._analyze_design_patterns(signals, _get_readme_lower(context))
         score += pattern_analysis['score']
         evidence.extend(pattern_analysis['evidence'])
         insights.extend(pattern_analysis['insights'])
         
         # Analyze scalability
-        scalability_analysis = self._analyze_scalability(file_tree, artifacts)
+        scalability_analysis = self._analyze_scalability(signals, artifacts)
         score += scalability_analysis['score']
         evidence.extend(scalability_analysis['evidence'])
         recommendations.extend(scalability_analysis['recommendations'])
         
         # Analyze security architecture
-        security_analysis = self._analyze_security_architecture(file_tree, artifacts)
+        security_analysis = self._analyze_security_architecture(signals, artifacts)
         score += security_analysis['score']
         evidence.extend(security_analysis['evidence'])
         risks.extend(security_analysis['risks'])
         
         # Analyze code-to-architecture alignment
-        alignment_analysis = self._analyze_code_architecture_alignment(file_tree, readme)
+        alignment_analysis = self._analyze_code_architecture_alignment(signals, readme)
         score += alignment_analysis['score']
         evidence.extend(alignment_analysis['evidence'])
         insights.extend(alignment_analysis['insights'])
@@ -605,7 +942,7 @@ class ArchitectureAgent(BaseAIAgent):
             risks=risks
         )
     
-    def _analyze_structure(self, file_tree: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_structure(self, signals: ArchitectureSignals) -> Dict[str, Any]:
         """Analyze project structure"""
         result = {
             'score': 0,
@@ -613,20 +950,10 @@ class ArchitectureAgent(BaseAIAgent):
             'recommendations': []
         }
         
-        # Count directories and files
-        directories = [f for f in file_tree if f.get('type') == 'tree']
-        files = [f for f in file_tree if f.get('type') == 'blob']
-        
-        result['evidence'].append(f"Project structure: {len(directories)} directories, {len(files)} files")
+        result['evidence'].append(f"Project structure: {signals.directory_count} directories, {signals.file_count} files")
         
         # Check for common good practices
-        good_dirs = ['src', 'lib', 'app', 'components', 'utils', 'config', 'tests', 'docs']
-        found_dirs = set()
-        
-        for dir_info in directories:
-            dir_name = dir_info.get('path', '').split('/')[0]
-            if dir_name in good_dirs:
-                found_dirs.add(dir_name)
+        found_dirs = signals.top_dirs
         
         if len(found_dirs) >= 3:
             result['score'] += 3
@@ -639,7 +966,7 @@ class ArchitectureAgent(BaseAIAgent):
         
         return result
     
-    def _analyze_design_patterns(self, file_tree: List[Dict[str, Any]], readme: str) -> Dict[str, Any]:
+    def _analyze_design_patterns(self, signals: ArchitectureSignals, readme_lower: str) -> Dict[str, Any]:
         """Comprehensive design pattern and architecture analysis following evaluation parameters"""
         result = {
             'score': 0,
@@ -648,26 +975,9 @@ class ArchitectureAgent(BaseAIAgent):
         }
         
         # Enhanced architectural pattern detection
-        patterns = {
-            'mvc': ['controller', 'model', 'view', 'mvc'],
-            'microservices': ['service', 'api', 'gateway', 'microservice'],
-            'layered': ['presentation', 'business', 'data', 'layer'],
-            'component': ['component', 'module', 'widget', 'ui'],
-            'event_driven': ['event', 'listener', 'handler', 'publisher'],
-            'hexagonal': ['port', 'adapter', 'hexagon'],
-            'clean_architecture': ['domain', 'application', 'infrastructure']
-        }
-        
-        found_patterns = []
-        layer_analysis = self._analyze_layer_separation(file_tree)
-        data_flow_analysis = self._analyze_data_flow(file_tree)
-        
-        for pattern_name, keywords in patterns.items():
-            for file_info in file_tree:
-                file_path = file_info.get('path', '').lower()
-                if any(keyword in file_path for keyword in keywords):
-                    found_patterns.append(pattern_name)
-                    break
+        found_patterns = signals.patterns
+        layer_analysis = self._analyze_layer_separation(signals)
+        data_flow_analysis = self._analyze_data_flow(signals)
         
         if found_patterns:
             result['score'] += 2
@@ -687,13 +997,13 @@ class ArchitectureAgent(BaseAIAgent):
             result['insights'].extend(data_flow_analysis['insights'])
         
         # Check README for architecture documentation
-        if readme and any(keyword in readme.lower() for keyword in ['architecture', 'design', 'pattern']):
+        if readme_lower and _keyword_search('architecture', 'design', 'pattern')(readme_lower):
             result['score'] += 1
             result['evidence'].append("Architecture documented in README")
         
         return result
     
-    def _analyze_layer_separation(self, file_tree: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_layer_separation(self, signals: ArchitectureSignals) -> Dict[str, Any]:
         """Analyze layer separation in architecture"""
         result = {
             'score': 0,
@@ -702,20 +1012,7 @@ class ArchitectureAgent(BaseAIAgent):
         }
         
         # Check for clear layer separation
-        layers = {
-            'presentation': ['ui', 'view', 'component', 'page', 'screen'],
-            'business': ['service', 'logic', 'business', 'domain'],
-            'data': ['model', 'entity', 'repository', 'dao', 'database'],
-            'infrastructure': ['config', 'util', 'helper', 'common']
-        }
-        
-        found_layers = set()
-        for layer_name, keywords in layers.items():
-            for file_info in file_tree:
-                file_path = file_info.get('path', '').lower()
-                if any(keyword in file_path for keyword in keywords):
-                    found_layers.add(layer_name)
-                    break
+        found_layers = signals.layers
         
         if len(found_layers) >= 3:
             result['score'] += 2
@@ -728,7 +1025,7 @@ class ArchitectureAgent(BaseAIAgent):
         
         return result
     
-    def _analyze_data_flow(self, file_tree: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_data_flow(self, signals: ArchitectureSignals) -> Dict[str, Any]:
         """Analyze data flow and control flow in architecture"""
         result = {
             'score': 0,
@@ -737,18 +1034,8 @@ class ArchitectureAgent(BaseAIAgent):
         }
         
         # Check for data flow indicators
-        data_flow_indicators = ['api', 'endpoint', 'route', 'controller', 'service', 'repository']
-        control_flow_indicators = ['middleware', 'interceptor', 'filter', 'guard', 'decorator']
-        
-        data_flow_count = 0
-        control_flow_count = 0
-        
-        for file_info in file_tree:
-            file_path = file_info.get('path', '').lower()
-            if any(indicator in file_path for indicator in data_flow_indicators):
-                data_flow_count += 1
-            if any(indicator in file_path for indicator in control_flow_indicators):
-                control_flow_count += 1
+        data_flow_count = signals.indicator_counts['data_flow']
+        control_flow_count = signals.indicator_counts['control_flow']
         
         if data_flow_count >= 3:
             result['score'] += 1
@@ -762,7 +1049,7 @@ class ArchitectureAgent(BaseAIAgent):
         
         return result
     
-    def _analyze_scalability(self, file_tree: List[Dict[str, Any]], artifacts: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_scalability(self, signals: ArchitectureSignals, artifacts: Dict[str, Any]) -> Dict[str, Any]:
         """Comprehensive scalability and performance readiness analysis"""
         result = {
             'score': 0,
@@ -771,47 +1058,38 @@ class ArchitectureAgent(BaseAIAgent):
         }
         
         # Horizontal/Vertical Scalability Design
-        scalability_analysis = self._analyze_scalability_design(file_tree)
+        scalability_analysis = self._analyze_scalability_design(signals)
         result['score'] += scalability_analysis['score']
         result['evidence'].extend(scalability_analysis['evidence'])
         result['recommendations'].extend(scalability_analysis['recommendations'])
         
         # Caching Strategy Analysis
-        caching_analysis = self._analyze_caching_strategy(file_tree)
+        caching_analysis = self._analyze_caching_strategy(signals)
         result['score'] += caching_analysis['score']
         result['evidence'].extend(caching_analysis['evidence'])
         
         # Async Processing Implementation
-        async_analysis = self._analyze_async_processing(file_tree)
+        async_analysis = self._analyze_async_processing(signals)
         result['score'] += async_analysis['score']
         result['evidence'].extend(async_analysis['evidence'])
         
         # Load Handling Capability
-        load_analysis = self._analyze_load_handling(file_tree)
+        load_analysis = self._analyze_load_handling(signals)
         result['score'] += load_analysis['score']
         result['evidence'].extend(load_analysis['evidence'])
         
         # Check for configuration management
-        config_files = ['.env', 'config', 'settings', 'docker']
-        found_config = False
-        
-        for file_info in file_tree:
-            file_path = file_info.get('path', '').lower()
-            if any(config in file_path for config in config_files):
-                found_config = True
-                break
-        
-        if found_config:
+        if signals.indicator_counts['config']:
             result['score'] += 1
             result['evidence'].append("Configuration management present")
         
         # Check for containerization
-        if any('dockerfile' in f.get('path', '').lower() for f in file_tree):
+        if signals.has_dockerfile:
             result['score'] += 2
             result['evidence'].append("Containerization (Docker) present")
         
         # Check for CI/CD
-        if any('.github' in f.get('path', '') for f in file_tree):
+        if signals.has_github:
             result['score'] += 1
             result['evidence'].append("CI/CD pipeline present")
         
@@ -822,7 +1100,7 @@ class ArchitectureAgent(BaseAIAgent):
         
         return result
     
-    def _analyze_scalability_design(self, file_tree: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_scalability_design(self, signals: ArchitectureSignals) -> Dict[str, Any]:
         """Analyze horizontal/vertical scalability design"""
         result = {
             'score': 0,
@@ -830,19 +1108,9 @@ class ArchitectureAgent(BaseAIAgent):
             'recommendations': []
         }
         
-        # Check for horizontal scalability indicators
-        horizontal_indicators = ['load_balancer', 'cluster', 'distributed', 'microservice', 'api_gateway']
-        vertical_indicators = ['optimization', 'performance', 'memory', 'cpu', 'resource']
-        
-        horizontal_count = 0
-        vertical_count = 0
-        
-        for file_info in file_tree:
-            file_path = file_info.get('path', '').lower()
-            if any(indicator in file_path for indicator in horizontal_indicators):
-                horizontal_count += 1
-            if any(indicator in file_path for indicator in vertical_indicators):
-                vertical_count += 1
+        # Check for horizontal and vertical scalability indicators
+        horizontal_count = signals.indicator_counts['horizontal']
+        vertical_count = signals.indicator_counts['vertical']
         
         if horizontal_count >= 2:
             result['score'] += 2
@@ -857,7 +1125,7 @@ class ArchitectureAgent(BaseAIAgent):
         
         return result
     
-    def _analyze_caching_strategy(self, file_tree: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_caching_strategy(self, signals: ArchitectureSignals) -> Dict[str, Any]:
         """Analyze caching strategy implementation"""
         result = {
             'score': 0,
@@ -865,13 +1133,7 @@ class ArchitectureAgent(BaseAIAgent):
         }
         
         # Check for caching indicators
-        caching_indicators = ['cache', 'redis', 'memcached', 'session', 'storage']
-        caching_count = 0
-        
-        for file_info in file_tree:
-            file_path = file_info.get('path', '').lower()
-            if any(indicator in file_path for indicator in caching_indicators):
-                caching_count += 1
+        caching_count = signals.indicator_counts['caching']
         
         if caching_count >= 2:
             result['score'] += 2
@@ -882,7 +1144,7 @@ class ArchitectureAgent(BaseAIAgent):
         
         return result
     
-    def _analyze_async_processing(self, file_tree: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_async_processing(self, signals: ArchitectureSignals) -> Dict[str, Any]:
         """Analyze async processing implementation"""
         result = {
             'score': 0,
@@ -890,13 +1152,7 @@ class ArchitectureAgent(BaseAIAgent):
         }
         
         # Check for async indicators
-        async_indicators = ['async', 'await', 'promise', 'future', 'callback', 'queue', 'worker']
-        async_count = 0
-        
-        for file_info in file_tree:
-            file_path = file_info.get('path', '').lower()
-            if any(indicator in file_path for indicator in async_indicators):
-                async_count += 1
+        async_count = signals.indicator_counts['async']
         
         if async_count >= 2:
             result['score'] += 2
@@ -907,7 +1163,7 @@ class ArchitectureAgent(BaseAIAgent):
         
         return result
     
-    def _analyze_load_handling(self, file_tree: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_load_handling(self, signals: ArchitectureSignals) -> Dict[str, Any]:
         """Analyze load handling capability"""
         result = {
             'score': 0,
@@ -915,13 +1171,7 @@ class ArchitectureAgent(BaseAIAgent):
         }
         
         # Check for load handling indicators
-        load_indicators = ['rate_limit', 'throttle', 'circuit_breaker', 'bulkhead', 'timeout']
-        load_count = 0
-        
-        for file_info in file_tree:
-            file_path = file_info.get('path', '').lower()
-            if any(indicator in file_path for indicator in load_indicators):
-                load_count += 1
+        load_count = signals.indicator_counts['load']
         
         if load_count >= 2:
             result['score'] += 2
@@ -932,7 +1182,7 @@ class ArchitectureAgent(BaseAIAgent):
         
         return result
     
-    def _analyze_code_architecture_alignment(self, file_tree: List[Dict[str, Any]], readme: str) -> Dict[str, Any]:
+    def _analyze_code_architecture_alignment(self, signals: ArchitectureSignals, readme: str) -> Dict[str, Any]:
         """Analyze code-to-architecture alignment"""
         result = {
             'score': 0,
@@ -941,20 +1191,20 @@ class ArchitectureAgent(BaseAIAgent):
         }
         
         # Check for architectural consistency
-        consistency_analysis = self._check_architectural_consistency(file_tree)
+        consistency_analysis = self._check_architectural_consistency(signals)
         result['score'] += consistency_analysis['score']
         result['evidence'].extend(consistency_analysis['evidence'])
         result['insights'].extend(consistency_analysis['insights'])
         
         # Check for implementation gaps
-        gap_analysis = self._check_implementation_gaps(file_tree, readme)
+        gap_analysis = self._check_implementation_gaps(signals, readme)
         result['score'] += gap_analysis['score']
         result['evidence'].extend(gap_analysis['evidence'])
         result['insights'].extend(gap_analysis['insights'])
         
         return result
     
-    def _check_architectural_consistency(self, file_tree: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _check_architectural_consistency(self, signals: ArchitectureSignals) -> Dict[str, Any]:
         """Check for architectural consistency between design and implementation"""
         result = {
             'score': 0,
@@ -963,14 +1213,7 @@ class ArchitectureAgent(BaseAIAgent):
         }
         
         # Check for consistent architectural patterns
-        pattern_consistency = 0
-        architectural_files = []
-        
-        for file_info in file_tree:
-            file_path = file_info.get('path', '').lower()
-            if any(pattern in file_path for pattern in ['controller', 'service', 'model', 'repository', 'component']):
-                architectural_files.append(file_path)
-                pattern_consistency += 1
+        pattern_consistency = signals.indicator_counts['architectural']
         
         if pattern_consistency >= 4:
             result['score'] += 2
@@ -983,7 +1226,7 @@ class ArchitectureAgent(BaseAIAgent):
         
         return result
     
-    def _check_implementation_gaps(self, file_tree: List[Dict[str, Any]], readme: str) -> Dict[str, Any]:
+    def _check_implementation_gaps(self, signals: ArchitectureSignals, readme: str) -> Dict[str, Any]:
         """Check for gaps between architecture and implementation"""
         result = {
             'score': 0,
@@ -992,14 +1235,8 @@ class ArchitectureAgent(BaseAIAgent):
         }
         
         # Check for missing architectural components
-        expected_components = ['controller', 'service', 'model', 'repository', 'component', 'api']
-        found_components = set()
-        
-        for file_info in file_tree:
-            file_path = file_info.get('path', '').lower()
-            for component in expected_components:
-                if component in file_path:
-                    found_components.add(component)
+        expected_components = _EXPECTED_COMPONENTS
+        found_components = signals.components
         
         coverage_ratio = len(found_components) / len(expected_components)
         
@@ -1017,7 +1254,7 @@ class ArchitectureAgent(BaseAIAgent):
         
         return result
     
-    def _analyze_security_architecture(self, file_tree: List[Dict[str, Any]], artifacts: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_security_architecture(self, signals: ArchitectureSignals, artifacts: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze security architecture"""
         result = {
             'score': 0,
@@ -1026,23 +1263,14 @@ class ArchitectureAgent(BaseAIAgent):
         }
         
         # Check for security-related files
-        security_files = ['security', 'auth', 'middleware', 'guard', 'jwt']
-        found_security = False
-        
-        for file_info in file_tree:
-            file_path = file_info.get('path', '').lower()
-            if any(sec in file_path for sec in security_files):
-                found_security = True
-                result['evidence'].append(f"Security file: {file_info.get('path')}")
-                break
-        
-        if found_security:
+        if signals.indicator_counts['security']:
+            result['evidence'].append(f"Security file: {signals.security_file}")
             result['score'] += 2
         else:
             result['risks'].append("No obvious security implementation found")
         
         # Check for environment configuration
-        if any('.env.example' in f.get('path', '') for f in file_tree):
+        if signals.has_env_example:
             result['score'] += 1
             result['evidence'].append("Environment variables template present")
         
@@ -1133,16 +1361,92 @@ class ArchitectureAgent(BaseAIAgent):
         return explanation
 
 
+# Runtime UI metrics: (analysis key, label, recommendation when the metric scores low)
+_UI_METRICS = (
+    ('visual_quality', 'visual quality', "Improve visual design and layout"),
+    ('accessibility', 'accessibility', "Enhance accessibility features (contrast, text size, keyboard navigation)"),
+    ('responsiveness', 'responsiveness', "Improve responsive design for different screen sizes"),
+    ('interactivity', 'interactivity', "Add more interactive elements and user feedback"),
+)
+
+
+# Metric tiers, best first: (score above which the tier applies, evidence template, points)
+_UI_METRIC_TIERS = (
+    (7, "Excellent {label} (score: {score:.1f})", 2),
+    (5, "Good {label} (score: {score:.1f})", 1),
+)
+_UI_METRIC_LOW_TEMPLATE = "{label} needs improvement (score: {score:.1f})"
+
+
+def _ui_metric_evidence(label: str, metric: float) -> Tuple[str, int]:
+    """Evidence line and score points for one runtime UI metric"""
+    for threshold, template, points in _UI_METRIC_TIERS:
+        if metric > threshold:
+            return template.format(label=label, score=metric), points
+    return _UI_METRIC_LOW_TEMPLATE.format(label=label.capitalize(), score=metric), 0
+
+
+# How long a project path existence check is trusted, in seconds
+_PATH_EXISTS_TTL = 30
+
+
+@functools.lru_cache(maxsize=128)
+def _path_exists_in_window(path: str, window: int) -> bool:
+    return os.path.exists(path)
+
+
+def _path_exists(path: str) -> bool:
+    """os.path.exists, remembered for up to _PATH_EXISTS_TTL seconds"""
+    return _path_exists_in_window(path, int(time.time() // _PATH_EXISTS_TTL))
+
+
+# Directories that don't affect how a project renders and can be huge to walk
+_MTIME_SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__', 'venv', '.venv'})
+
+
+def _project_mtime_ns(project_path: str) -> int:
+    """Newest modification time of any file in the project"""
+    newest = os.stat(project_path).st_mtime_ns
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = [d for d in dirs if d not in _MTIME_SKIP_DIRS]
+        for name in files:
+            try:
+                newest = max(newest, os.stat(os.path.join(root, name)).st_mtime_ns)
+            except OSError:
+                continue
+    return newest
+
+
+def _execute_web_app_cached(ui_renderer, cache: _LRUCache, project_path: str) -> Dict[str, Any]:
+    """Run the web app through the renderer, reusing the last successful run while the project is unchanged"""
+    cache_key = f"{os.path.abspath(project_path)}:{_project_mtime_ns(project_path)}"
+    execution_result = cache.get(cache_key)
+    if execution_result is None:
+        execution_result = ui_renderer.execute_web_app(project_path)
+        # Failures are often environment problems (missing npm, busy port), so always retry those
+        if execution_result['success']:
+            cache.set(cache_key, execution_result)
+    return execution_result
+
+
 class UIUXAgent(BaseAIAgent):
     """AI agent for UI/UX analysis with UI rendering capabilities"""
     
     def __init__(self, api_key: Optional[str] = None):
         super().__init__("UIUXAgent", api_key)
         self.ui_renderer = UIRenderer() if UI_RENDERING_AVAILABLE else None
+        self._ui_exec_cache = _LRUCache(max_size=32)
     
-    def analyze(self, context: Dict[str, Any]) -> AgentAnalysis:
+    def _analysis_key(self, context: Dict[str, Any]) -> Optional[str]:
+        # With a renderer the result also depends on the running app, which
+        # _analyze_ui_execution keys on the project's files itself
+        if self.ui_renderer:
+            return None
+        return super()._analysis_key(context)
+    
+    def _analyze_impl(self, context: Dict[str, Any]) -> AgentAnalysis:
         """Analyze UI/UX quality and accessibility"""
-        file_tree = context.get('file_tree', [])
+        files = _get_file_columns(context)
         readme = context.get('readme', '')
         artifacts = context.get('artifacts', {})
         
@@ -1153,19 +1457,19 @@ class UIUXAgent(BaseAIAgent):
         score = 0
         
         # Analyze UI files
-        ui_analysis = self._analyze_ui_files(file_tree)
+        ui_analysis = self._analyze_ui_files(files)
         score += ui_analysis['score']
         evidence.extend(ui_analysis['evidence'])
         recommendations.extend(ui_analysis['recommendations'])
         
         # Analyze accessibility
-        a11y_analysis = self._analyze_accessibility(file_tree, artifacts)
+        a11y_analysis = self._analyze_accessibility(files, artifacts)
         score += a11y_analysis['score']
         evidence.extend(a11y_analysis['evidence'])
         recommendations.extend(a11y_analysis['recommendations'])
         
         # Analyze responsive design
-        responsive_analysis = self._analyze_responsive_design(file_tree)
+        responsive_analysis = self._analyze_responsive_design(files)
         score += responsive_analysis['score']
         evidence.extend(responsive_analysis['evidence'])
         
@@ -1216,7 +1520,7 @@ class UIUXAgent(BaseAIAgent):
             risks=risks
         )
     
-    def _analyze_ui_files(self, file_tree: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_ui_files(self, files: FileTreeColumns) -> Dict[str, Any]:
         """Analyze UI-related files"""
         result = {
             'score': 0,
@@ -1224,14 +1528,10 @@ class UIUXAgent(BaseAIAgent):
             'recommendations': []
         }
         
-        ui_extensions = ['.html', '.jsx', '.tsx', '.vue', '.svelte', '.css', '.scss', '.sass']
-        ui_files = []
-        
-        for file_info in file_tree:
-            if file_info.get('type') == 'blob':
-                file_path = file_info.get('path', '')
-                if any(file_path.endswith(ext) for ext in ui_extensions):
-                    ui_files.append(file_path)
+        ui_files = [
+            file_path for file_path, file_type in zip(files.paths, files.types)
+            if file_type == 'blob' and file_path[file_path.rfind('.'):] in _UI_ASSET_EXTS
+        ]
         
         if ui_files:
             result['score'] += 3  # Increased base score
@@ -1260,7 +1560,8 @@ class UIUXAgent(BaseAIAgent):
                 result['evidence'].append(f"Component-based architecture ({len(components)} components)")
             
             # Check for CSS frameworks
-            css_frameworks = [f for f in ui_files if any(fw in f.lower() for fw in ['bootstrap', 'tailwind', 'material', 'bulma'])]
+            has_css_framework = _keyword_search('bootstrap', 'tailwind', 'material', 'bulma')
+            css_frameworks = [f for f in ui_files if has_css_framework(f.lower())]
             if css_frameworks:
                 result['score'] += 1
                 result['evidence'].append("CSS framework detected - improved styling")
@@ -1275,7 +1576,7 @@ class UIUXAgent(BaseAIAgent):
         
         return result
     
-    def _analyze_accessibility(self, file_tree: List[Dict[str, Any]], artifacts: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_accessibility(self, files: FileTreeColumns, artifacts: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze accessibility features"""
         result = {
             'score': 0,
@@ -1284,17 +1585,10 @@ class UIUXAgent(BaseAIAgent):
         }
         
         # Check for accessibility files
-        a11y_files = ['accessibility', 'a11y', 'aria', 'semantic']
-        found_a11y = False
+        a11y_file = files.first_lower_match(_keyword_search('accessibility', 'a11y', 'aria', 'semantic'))
         
-        for file_info in file_tree:
-            file_path = file_info.get('path', '').lower()
-            if any(a11y in file_path for a11y in a11y_files):
-                found_a11y = True
-                result['evidence'].append(f"Accessibility file: {file_info.get('path')}")
-                break
-        
-        if found_a11y:
+        if a11y_file is not None:
+            result['evidence'].append(f"Accessibility file: {a11y_file}")
             result['score'] += 2
         else:
             result['recommendations'].append("Add accessibility considerations")
@@ -1306,7 +1600,7 @@ class UIUXAgent(BaseAIAgent):
         
         return result
     
-    def _analyze_responsive_design(self, file_tree: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_responsive_design(self, files: FileTreeColumns) -> Dict[str, Any]:
         """Analyze responsive design implementation"""
         result = {
             'score': 0,
@@ -1314,14 +1608,14 @@ class UIUXAgent(BaseAIAgent):
         }
         
         # Look for CSS files that might contain responsive design
-        css_files = [f for f in file_tree if f.get('path', '').endswith(('.css', '.scss', '.sass'))]
+        css_files = [path for path in files.paths if path.endswith(('.css', '.scss', '.sass'))]
         
         if css_files:
             result['score'] += 1
             result['evidence'].append("Styling files present")
         
         # Check for mobile-specific files
-        mobile_files = [f for f in file_tree if 'mobile' in f.get('path', '').lower()]
+        mobile_files = [path for path in files.paths_lower if 'mobile' in path]
         if mobile_files:
             result['score'] += 1
             result['evidence'].append("Mobile-specific files found")
@@ -1349,11 +1643,11 @@ class UIUXAgent(BaseAIAgent):
         try:
             # Get project path from context
             project_path = context.get('project_path', '.')
-            if not os.path.exists(project_path):
+            if not _path_exists(project_path):
                 return None
             
             # Try to execute the application
-            execution_result = self.ui_renderer.execute_web_app(project_path)
+            execution_result = _execute_web_app_cached(self.ui_renderer, self._ui_exec_cache, project_path)
             
             if not execution_result['success']:
                 errors = execution_result.get('errors', ['Unknown error'])
@@ -1394,53 +1688,13 @@ class UIUXAgent(BaseAIAgent):
             insights = []
             score = 0
             
-            # Visual quality analysis
-            visual_quality = ui_analysis.get('visual_quality', 0)
-            if visual_quality > 7:
-                evidence.append(f"Excellent visual quality (score: {visual_quality:.1f})")
-                score += 2
-            elif visual_quality > 5:
-                evidence.append(f"Good visual quality (score: {visual_quality:.1f})")
-                score += 1
-            else:
-                evidence.append(f"Visual quality needs improvement (score: {visual_quality:.1f})")
-                recommendations.append("Improve visual design and layout")
-            
-            # Accessibility analysis
-            accessibility = ui_analysis.get('accessibility', 0)
-            if accessibility > 7:
-                evidence.append(f"Excellent accessibility (score: {accessibility:.1f})")
-                score += 2
-            elif accessibility > 5:
-                evidence.append(f"Good accessibility (score: {accessibility:.1f})")
-                score += 1
-            else:
-                evidence.append(f"Accessibility needs improvement (score: {accessibility:.1f})")
-                recommendations.append("Enhance accessibility features (contrast, text size, keyboard navigation)")
-            
-            # Responsiveness analysis
-            responsiveness = ui_analysis.get('responsiveness', 0)
-            if responsiveness > 7:
-                evidence.append(f"Excellent responsiveness (score: {responsiveness:.1f})")
-                score += 2
-            elif responsiveness > 5:
-                evidence.append(f"Good responsiveness (score: {responsiveness:.1f})")
-                score += 1
-            else:
-                evidence.append(f"Responsiveness needs improvement (score: {responsiveness:.1f})")
-                recommendations.append("Improve responsive design for different screen sizes")
-            
-            # Interactivity analysis
-            interactivity = ui_analysis.get('interactivity', 0)
-            if interactivity > 7:
-                evidence.append(f"Excellent interactivity (score: {interactivity:.1f})")
-                score += 2
-            elif interactivity > 5:
-                evidence.append(f"Good interactivity (score: {interactivity:.1f})")
-                score += 1
-            else:
-                evidence.append(f"Interactivity needs improvement (score: {interactivity:.1f})")
-                recommendations.append("Add more interactive elements and user feedback")
+            # Visual quality, accessibility, responsiveness and interactivity
+            for key, label, recommendation in _UI_METRICS:
+                metric_evidence, points = _ui_metric_evidence(label, ui_analysis.get(key, 0))
+                evidence.append(metric_evidence)
+                score += points
+                if not points:
+                    recommendations.append(recommendation)
             
             # Screenshot analysis
             if screenshots:
@@ -1552,9 +1806,9 @@ class SecurityAgent(BaseAIAgent):
     def __init__(self, api_key: Optional[str] = None):
         super().__init__("SecurityAgent", api_key)
     
-    def analyze(self, context: Dict[str, Any]) -> AgentAnalysis:
+    def _analyze_impl(self, context: Dict[str, Any]) -> AgentAnalysis:
         """Analyze security posture"""
-        file_tree = context.get('file_tree', [])
+        files = _get_file_columns(context)
         readme = context.get('readme', '')
         artifacts = context.get('artifacts', {})
         
@@ -1565,26 +1819,26 @@ class SecurityAgent(BaseAIAgent):
         score = 0
         
         # Analyze secrets management
-        secrets_analysis = self._analyze_secrets_management(file_tree)
+        secrets_analysis = self._analyze_secrets_management(files)
         score += secrets_analysis['score']
         evidence.extend(secrets_analysis['evidence'])
         risks.extend(secrets_analysis['risks'])
         recommendations.extend(secrets_analysis['recommendations'])
         
         # Analyze dependencies
-        deps_analysis = self._analyze_dependencies(file_tree, artifacts)
+        deps_analysis = self._analyze_dependencies(files, artifacts)
         score += deps_analysis['score']
         evidence.extend(deps_analysis['evidence'])
         risks.extend(deps_analysis['risks'])
         
         # Analyze input validation
-        validation_analysis = self._analyze_input_validation(file_tree)
+        validation_analysis = self._analyze_input_validation(files)
         score += validation_analysis['score']
         evidence.extend(validation_analysis['evidence'])
         recommendations.extend(validation_analysis['recommendations'])
         
         # Analyze authentication
-        auth_analysis = self._analyze_authentication(file_tree)
+        auth_analysis = self._analyze_authentication(files)
         score += auth_analysis['score']
         evidence.extend(auth_analysis['evidence'])
         recommendations.extend(auth_analysis['recommendations'])
@@ -1621,7 +1875,7 @@ class SecurityAgent(BaseAIAgent):
             risks=risks
         )
     
-    def _analyze_secrets_management(self, file_tree: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_secrets_management(self, files: FileTreeColumns) -> Dict[str, Any]:
         """Analyze secrets management"""
         result = {
             'score': 0,
@@ -1631,7 +1885,7 @@ class SecurityAgent(BaseAIAgent):
         }
         
         # Check for .env.example
-        if any('.env.example' in f.get('path', '') for f in file_tree):
+        if any('.env.example' in path for path in files.paths):
             result['score'] += 2
             result['evidence'].append("Environment variables template present")
         else:
@@ -1639,14 +1893,14 @@ class SecurityAgent(BaseAIAgent):
             result['recommendations'].append("Add .env.example file")
         
         # Check for .env in gitignore
-        gitignore_files = [f for f in file_tree if f.get('path', '').endswith('.gitignore')]
+        gitignore_files = [path for path in files.paths if path.endswith('.gitignore')]
         if gitignore_files:
             result['score'] += 1
             result['evidence'].append(".gitignore file present")
         
         return result
     
-    def _analyze_dependencies(self, file_tree: List[Dict[str, Any]], artifacts: Dict[str, Any]) -> Dict[str, Any]:
+    def _analyze_dependencies(self, files: FileTreeColumns, artifacts: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze dependency security"""
         result = {
             'score': 0,
@@ -1655,16 +1909,11 @@ class SecurityAgent(BaseAIAgent):
         }
         
         # Check for package files
-        package_files = ['package.json', 'requirements.txt', 'pom.xml', 'Cargo.toml']
-        found_packages = False
-        
-        for file_info in file_tree:
-            if file_info.get('path', '').split('/')[-1] in package_files:
-                found_packages = True
-                result['evidence'].append(f"Package file: {file_info.get('path')}")
-                break
+        package_files = {'package.json', 'requirements.txt', 'pom.xml', 'Cargo.toml'}
+        package_file = files.first_path(package_files.__contains__, files.basenames)
         
-        if found_packages:
+        if package_file is not None:
+            result['evidence'].append(f"Package file: {package_file}")
             result['score'] += 1
         
         # Check for security scan results
@@ -1678,7 +1927,7 @@ class SecurityAgent(BaseAIAgent):
         
         return result
     
-    def _analyze_input_validation(self, file_tree: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_input_validation(self, files: FileTreeColumns) -> Dict[str, Any]:
         """Analyze input validation"""
         result = {
             'score': 0,
@@ -1687,24 +1936,17 @@ class SecurityAgent(BaseAIAgent):
         }
         
         # Look for validation files
-        validation_files = ['validator', 'validation', 'schema', 'middleware']
-        found_validation = False
+        validation_file = files.first_lower_match(_keyword_search('validator', 'validation', 'schema', 'middleware'))
         
-        for file_info in file_tree:
-            file_path = file_info.get('path', '').lower()
-            if any(val in file_path for val in validation_files):
-                found_validation = True
-                result['evidence'].append(f"Validation file: {file_info.get('path')}")
-                break
-        
-        if found_validation:
+        if validation_file is not None:
+            result['evidence'].append(f"Validation file: {validation_file}")
             result['score'] += 2
         else:
             result['recommendations'].append("Add input validation")
         
         return result
     
-    def _analyze_authentication(self, file_tree: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_authentication(self, files: FileTreeColumns) -> Dict[str, Any]:
         """Analyze authentication implementation"""
         result = {
             'score': 0,
@@ -1713,17 +1955,10 @@ class SecurityAgent(BaseAIAgent):
         }
         
         # Look for auth-related files
-        auth_files = ['auth', 'login', 'jwt', 'oauth', 'session']
-        found_auth = False
-        
-        for file_info in file_tree:
-            file_path = file_info.get('path', '').lower()
-            if any(auth in file_path for auth in auth_files):
-                found_auth = True
-                result['evidence'].append(f"Authentication file: {file_info.get('path')}")
-                break
+        auth_file = files.first_lower_match(_keyword_search('auth', 'login', 'jwt', 'oauth', 'session'))
         
-        if found_auth:
+        if auth_file is not None:
+            result['evidence'].append(f"Authentication file: {auth_file}")
             result['score'] += 2
         else:
             result['recommendations'].append("Implement authentication system")
@@ -1798,24 +2033,70 @@ class SecurityAgent(BaseAIAgent):
         return explanation
 
 
+# File suffixes counted by LearningAgent._extract_features - tuples so endswith() checks them all in one call
+_FEATURE_CODE_SUFFIXES = ('.py', '.js', '.ts', '.java', '.go', '.rs', '.cpp', '.c')
+_FEATURE_DOC_SUFFIXES = ('.md', '.rst')
+_FEATURE_UI_SUFFIXES = ('.html', '.jsx', '.tsx', '.vue', '.css', '.scss')
+
+# Most analyses LearningAgent keeps in memory and reloads on startup
+_MAX_LEARNING_RECORDS = 1000
+
+
+def _newest(records: deque, count: int) -> List[Any]:
+    """The last count records, oldest first, read from the right end of the deque"""
+    newest = list(itertools.islice(reversed(records), count))
+    newest.reverse()
+    return newest
+
+# Language for each file suffix LearningAgent._detect_technology_stack recognizes
+_FEATURE_SUFFIX_TO_TECH = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.jsx': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.tsx': 'TypeScript',
+    '.java': 'Java',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.cpp': 'C++',
+    '.c': 'C++',
+    '.php': 'PHP',
+    '.rb': 'Ruby',
+    '.swift': 'Swift',
+    '.kt': 'Kotlin',
+}
+
+
 class LearningAgent(BaseAIAgent):
     """The learning agent - gets smarter over time"""
     
+    # Every analysis updates what we've learned, so never skip one
+    _cache_inputs = None
+    
     def __init__(self, api_key: Optional[str] = None):
         super().__init__("LearningAgent", api_key)
         # Store what we've learned
-        self.learning_data = []
+        self.learning_data = deque(maxlen=_MAX_LEARNING_RECORDS)  # oldest analyses fall off the left
         self.pattern_weights = defaultdict(float)
         self.technology_patterns = defaultdict(list)
         self.score_predictions = {}
         self.quality_indicators = defaultdict(int)
         self.learning_model = None
-        self.model_file = "learning_model.pkl"
-        self.data_file = "learning_data.json"
+        self.model_file = "learning_model.json"  # pattern weights and technology averages
+        self.data_file = "learning_data.ndjson"  # one analysis per line, appended as we go
+        self._legacy_data_file = "learning_data.json"  # everything in one document, from before the log
+        self._unsaved_records = []  # analyses not yet appended to data_file
+        self._logged_records = 0  # lines in data_file, including ones we've since trimmed
+        # Score totals per technology over the last 50 analyses, for _update_learning_model
+        self._tech_window = deque(maxlen=50)  # (technology_stack, score) per analysis
+        self._tech_totals = {}  # tech -> [score sum, count]
+        # get_learning_stats result, reused until what we've learned changes
+        self._stats_version = 0
+        self._stats_cache = None  # (version, stats)
         # Load any previous learning
         self._load_learning_data()
     
-    def analyze(self, context: Dict[str, Any]) -> AgentAnalysis:
+    def _analyze_impl(self, context: Dict[str, Any]) -> AgentAnalysis:
         """Use what we've learned to analyze this submission"""
         evidence = []
         recommendations = []
@@ -1890,97 +2171,77 @@ class LearningAgent(BaseAIAgent):
             'complexity_score': 0.0
         }
         
-        file_tree = context.get('file_tree', [])
         readme = context.get('readme', '')
-        
-        # Count files by type
-        for file_info in file_tree:
-            if file_info.get('type') == 'blob':
-                file_path = file_info.get('path', '').lower()
-                features['file_count'] += 1
-                
-                # Code files
-                if any(file_path.endswith(ext) for ext in ['.py', '.js', '.ts', '.java', '.go', '.rs', '.cpp', '.c']):
-                    features['code_file_count'] += 1
-                
-                # Test files
-                if 'test' in file_path:
-                    features['test_file_count'] += 1
-                    features['has_tests'] = True
-                
-                # Documentation files
-                if file_path.endswith(('.md', '.rst')):
-                    features['doc_file_count'] += 1
-                    features['has_docs'] = True
-                
-                # Configuration files
-                if any(config in file_path for config in ['.env', 'config', 'settings', 'package.json', 'requirements.txt']):
-                    features['config_file_count'] += 1
-                
-                # Docker
-                if 'dockerfile' in file_path:
-                    features['has_dockerfile'] = True
-                
-                # CI/CD
-                if '.github' in file_path:
-                    features['has_ci_cd'] = True
-                
-                # Security files
-                if any(sec in file_path for sec in ['auth', 'security', 'jwt', 'middleware']):
-                    features['security_files'] += 1
-                
-                # UI files
-                if any(file_path.endswith(ext) for ext in ['.html', '.jsx', '.tsx', '.vue', '.css', '.scss']):
-                    features['ui_files'] += 1
+        files = _get_file_columns(context)
+        
+        is_config = _keyword_search('.env', 'config', 'settings', 'package.json', 'requirements.txt')
+        is_security = _keyword_search('auth', 'security', 'jwt', 'middleware')
+        
+        # Count files by type - tallied in locals and written to features once at the end
+        file_count = code_count = test_count = doc_count = config_count = security_count = ui_count = 0
+        has_dockerfile = has_ci_cd = False
+        for file_path, file_type in zip(files.paths_lower, files.types):
+            if file_type != 'blob':
+                continue
+            file_count += 1
+            
+            if file_path.endswith(_FEATURE_CODE_SUFFIXES):
+                code_count += 1
+            if 'test' in file_path:
+                test_count += 1
+            if file_path.endswith(_FEATURE_DOC_SUFFIXES):
+                doc_count += 1
+            if is_config(file_path):
+                config_count += 1
+            if is_security(file_path):
+                security_count += 1
+            if file_path.endswith(_FEATURE_UI_SUFFIXES):
+                ui_count += 1
+            
+            # Docker and CI/CD only need one hit
+            if not has_dockerfile and 'dockerfile' in file_path:
+                has_dockerfile = True
+            if not has_ci_cd and '.github' in file_path:
+                has_ci_cd = True
+        
+        features.update(
+            file_count=file_count,
+            code_file_count=code_count,
+            test_file_count=test_count,
+            doc_file_count=doc_count,
+            config_file_count=config_count,
+            security_files=security_count,
+            ui_files=ui_count,
+            has_dockerfile=has_dockerfile,
+            has_ci_cd=has_ci_cd,
+            has_tests=test_count > 0,
+            has_docs=doc_count > 0,
+        )
         
         # README analysis
         features['has_readme'] = bool(readme)
         
         # Technology stack detection
-        features['technology_stack'] = self._detect_technology_stack(file_tree, readme)
+        features['technology_stack'] = self._detect_technology_stack(files, _get_readme_lower(context))
         
         # Architecture patterns
-        features['architecture_patterns'] = self._detect_architecture_patterns(file_tree)
+        features['architecture_patterns'] = self._detect_architecture_patterns(files)
         
         # Complexity score
         features['complexity_score'] = self._calculate_complexity_score(features)
         
         return features
     
-    def _detect_technology_stack(self, file_tree: List[Dict], readme: str) -> List[str]:
+    def _detect_technology_stack(self, files: FileTreeColumns, readme_lower: str) -> List[str]:
         """Detect technology stack from files and README"""
-        stack = []
-        
-        # File-based detection
-        for file_info in file_tree:
-            file_path = file_info.get('path', '').lower()
-            
-            if file_path.endswith('.py'):
-                stack.append('Python')
-            elif file_path.endswith(('.js', '.jsx')):
-                stack.append('JavaScript')
-            elif file_path.endswith(('.ts', '.tsx')):
-                stack.append('TypeScript')
-            elif file_path.endswith('.java'):
-                stack.append('Java')
-            elif file_path.endswith('.go'):
-                stack.append('Go')
-            elif file_path.endswith('.rs'):
-                stack.append('Rust')
-            elif file_path.endswith(('.cpp', '.c')):
-                stack.append('C++')
-            elif file_path.endswith('.php'):
-                stack.append('PHP')
-            elif file_path.endswith('.rb'):
-                stack.append('Ruby')
-            elif file_path.endswith('.swift'):
-                stack.append('Swift')
-            elif file_path.endswith('.kt'):
-                stack.append('Kotlin')
+        # File-based detection - every known suffix starts with its only dot, so the
+        # text from a path's last dot is the one suffix it can end with. Big trees
+        # share a handful of suffixes, so each distinct one is looked up once.
+        suffixes = {path[path.rfind('.'):] for path in files.paths_lower}
+        stack = [_FEATURE_SUFFIX_TO_TECH[suffix] for suffix in suffixes if suffix in _FEATURE_SUFFIX_TO_TECH]
         
         # README-based detection
-        if readme:
-            readme_lower = readme.lower()
+        if readme_lower:
             if 'react' in readme_lower:
                 stack.append('React')
             if 'vue' in readme_lower:
@@ -2000,24 +2261,26 @@ class LearningAgent(BaseAIAgent):
         
         return list(set(stack))  # Remove duplicates
     
-    def _detect_architecture_patterns(self, file_tree: List[Dict]) -> List[str]:
+    def _detect_architecture_patterns(self, files: FileTreeColumns) -> List[str]:
         """Detect architecture patterns from file structure"""
         patterns = []
+        # No keyword contains a NUL, so a hit in the joined paths is a hit in one path
+        paths = files.lower_blob
         
         # MVC pattern
-        if any('controller' in f.get('path', '').lower() for f in file_tree):
+        if 'controller' in paths:
             patterns.append('MVC')
         
         # Microservices pattern
-        if any('service' in f.get('path', '').lower() for f in file_tree):
+        if 'service' in paths:
             patterns.append('Microservices')
         
         # Component-based pattern
-        if any('component' in f.get('path', '').lower() for f in file_tree):
+        if 'component' in paths:
             patterns.append('Component-based')
         
         # Layered architecture
-        if any(keyword in f.get('path', '').lower() for f in file_tree for keyword in ['presentation', 'business', 'data']):
+        if _keyword_search('presentation', 'business', 'data')(paths):
             patterns.append('Layered')
         
         return patterns
@@ -2088,10 +2351,13 @@ class LearningAgent(BaseAIAgent):
         if features['architecture_patterns']:
             score += 1.0
         
-        # Apply learned weights
-        for pattern, weight in self.pattern_weights.items():
-            if pattern in str(features):
-                score += weight
+        # Apply learned weights for the patterns this submission shows - the same
+        # names _update_pattern_weights learns them under
+        active_patterns = {f"tech_{tech}" for tech in features['technology_stack']}
+        active_patterns.update(f"arch_{pattern}" for pattern in features['architecture_patterns'])
+        active_patterns.add('has_tests' if features['has_tests'] else 'no_tests')
+        active_patterns.add('has_docs' if features['has_docs'] else 'no_docs')
+        score += sum(self.pattern_weights[pattern] for pattern in active_patterns & self.pattern_weights.keys())
         
         # Normalize to 0-10 range
         return max(0, min(int(round(score)), 10))
@@ -2214,53 +2480,58 @@ class LearningAgent(BaseAIAgent):
             'features': features,
             'score': score,
             'confidence': confidence,
-            'context_keys': list(context.keys()),
+            'context_keys': [key for key in context if not key.startswith('_')],  # skip agents' scratch caches
             'file_count': features['file_count'],
             'code_file_count': features['code_file_count'],
             'technology_stack': features['technology_stack'],
             'architecture_patterns': features['architecture_patterns']
         }
         
-        self.learning_data.append(analysis_data)
-        
-        # Keep only recent data (last 1000 analyses)
-        if len(self.learning_data) > 1000:
-            self.learning_data = self.learning_data[-1000:]
+        self.learning_data.append(analysis_data)  # the deque keeps only the last 1000
+        self._unsaved_records.append(analysis_data)
+        self._track_tech_scores(features['technology_stack'], score)
+        self._stats_version += 1
         
         # Update pattern weights based on successful patterns
         self._update_pattern_weights(features, score)
         
-        # Save data periodically
-        if len(self.learning_data) % 10 == 0:
+        # Save data periodically - every 10 new analyses
+        if len(self._unsaved_records) >= 10:
             self._save_learning_data()
     
     def _update_pattern_weights(self, features: Dict, score: int):
         """Update pattern weights based on score"""
         # Positive patterns (high scores)
         if score >= 7:
-            for tech in features['technology_stack']:
-                self.pattern_weights[f"tech_{tech}"] += 0.1
-            
-            for pattern in features['architecture_patterns']:
-                self.pattern_weights[f"arch_{pattern}"] += 0.1
+            step = 0.1
+            nudged = [f"tech_{tech}" for tech in features['technology_stack']]
+            nudged.extend(f"arch_{pattern}" for pattern in features['architecture_patterns'])
             
             if features['has_tests']:
-                self.pattern_weights['has_tests'] += 0.1
+                nudged.append('has_tests')
             
             if features['has_docs']:
-                self.pattern_weights['has_docs'] += 0.1
+                nudged.append('has_docs')
         
         # Negative patterns (low scores)
         elif score <= 3:
+            step = -0.1
+            nudged = []
+            
             if not features['has_tests']:
-                self.pattern_weights['no_tests'] -= 0.1
+                nudged.append('no_tests')
             
             if not features['has_docs']:
-                self.pattern_weights['no_docs'] -= 0.1
+                nudged.append('no_docs')
+        
+        else:
+            return
         
-        # Normalize weights
-        for pattern in self.pattern_weights:
-            self.pattern_weights[pattern] = max(-1.0, min(1.0, self.pattern_weights[pattern]))
+        # Normalize weights - every other weight was kept in [-1, 1] by an earlier
+        # update, so only the ones nudged now need clamping
+        for pattern in nudged:
+            weight = self.pattern_weights[pattern] + step
+            self.pattern_weights[pattern] = -1.0 if weight < -1.0 else (1.0 if weight > 1.0 else weight)
     
     def _update_learning_model(self):
         """Update the learning model with new data"""
@@ -2268,57 +2539,117 @@ class LearningAgent(BaseAIAgent):
             return
         
         # Simple model update - in production, this would use scikit-learn or similar
-        recent_data = self.learning_data[-50:]  # Last 50 analyses
-        
-        # Calculate average scores by technology stack
-        tech_scores = defaultdict(list)
-        for data in recent_data:
-            for tech in data['technology_stack']:
-                tech_scores[tech].append(data['score'])
+        # Average scores by technology over the last 50 analyses, from the running totals
+        for tech, (total, count) in self._tech_totals.items():
+            if count >= 3:  # Minimum 3 samples
+                self.technology_patterns[tech] = total / count
         
-        # Update technology pattern scores
-        for tech, scores in tech_scores.items():
-            if len(scores) >= 3:  # Minimum 3 samples
-                avg_score = sum(scores) / len(scores)
-                self.technology_patterns[tech] = avg_score
+        self._stats_version += 1  # technology_patterns may have grown
+    
+    def _track_tech_scores(self, technology_stack: List[str], score: int):
+        """Slide the last-50 technology score window forward by one analysis"""
+        if len(self._tech_window) == self._tech_window.maxlen:
+            old_stack, old_score = self._tech_window[0]
+            for tech in old_stack:
+                totals = self._tech_totals[tech]
+                totals[0] -= old_score
+                totals[1] -= 1
+                if not totals[1]:
+                    del self._tech_totals[tech]
+        
+        self._tech_window.append((technology_stack, score))
+        for tech in technology_stack:
+            totals = self._tech_totals.setdefault(tech, [0, 0])
+            totals[0] += score
+            totals[1] += 1
     
     def _load_learning_data(self):
         """Load learning data from file"""
         try:
             if os.path.exists(self.data_file):
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    self.learning_data = data.get('learning_data', [])
-                    self.pattern_weights = defaultdict(float, data.get('pattern_weights', {}))
-                    self.technology_patterns = defaultdict(list, data.get('technology_patterns', {}))
+                # Only the newest records are kept, so stream the log instead of parsing it whole
+                recent = deque(maxlen=_MAX_LEARNING_RECORDS)
+                with open(self.data_file, 'rb') as f:
+                    for line in f:
+                        self._logged_records += 1
+                        try:
+                            recent.append(_loads_json(line))
+                        except ValueError:
+                            pass  # an interrupted save can leave a torn last line
+                self.learning_data = recent
+            
+            elif os.path.exists(self._legacy_data_file):
+                with open(self._legacy_data_file, 'rb') as f:
+                    data = _loads_json(f.read())
+                self.learning_data = deque(data.get('learning_data', []), maxlen=_MAX_LEARNING_RECORDS)
+                self.pattern_weights = defaultdict(float, data.get('pattern_weights', {}))
+                self.technology_patterns = defaultdict(list, data.get('technology_patterns', {}))
+                # Move the old history into the log on the next save
+                self._unsaved_records = list(self.learning_data)
+            
+            for record in _newest(self.learning_data, self._tech_window.maxlen):
+                self._track_tech_scores(record.get('technology_stack', []), record.get('score', 0))
+            
+            # Weights are saved on their own, and can exist before any history is logged
+            if os.path.exists(self.model_file):
+                with open(self.model_file, 'rb') as f:
+                    model = _loads_json(f.read())
+                self.pattern_weights = defaultdict(float, model.get('pattern_weights', {}))
+                self.technology_patterns = defaultdict(list, model.get('technology_patterns', {}))
         except Exception as e:
             print(f"Warning: Could not load learning data: {e}")
-            self.learning_data = []
+            self.learning_data = deque(maxlen=_MAX_LEARNING_RECORDS)
             self.pattern_weights = defaultdict(float)
             self.technology_patterns = defaultdict(list)
+            self._unsaved_records = []
+            self._logged_records = 0
+            self._tech_window.clear()
+            self._tech_totals = {}
     
     def _save_learning_data(self):
         """Save learning data to file"""
         try:
-            data = {
-                'learning_data': self.learning_data,
-                'pattern_weights': dict(self.pattern_weights),
-                'technology_patterns': dict(self.technology_patterns),
+            if self._logged_records + len(self._unsaved_records) > 2 * _MAX_LEARNING_RECORDS:
+                # The log is mostly trimmed records by now - rewrite it with just the ones we keep
+                self._compact_learning_log()
+            elif self._unsaved_records:
+                # Append only what's new, so a save doesn't cost more as the history grows
+                with open(self.data_file, 'a', encoding='utf-8') as f:
+                    f.write(''.join(_dumps_json(record) + '\n' for record in self._unsaved_records))
+                self._logged_records += len(self._unsaved_records)
+            self._unsaved_records = []
+            
+            # Both serializers write defaultdicts as plain objects, so no copies are needed
+            model = {
+                'pattern_weights': self.pattern_weights,
+                'technology_patterns': self.technology_patterns,
                 'last_updated': datetime.now().isoformat()
             }
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(self.model_file, 'w', encoding='utf-8') as f:
+                f.write(_dumps_json(model))
         except Exception as e:
             print(f"Warning: Could not save learning data: {e}")
     
+    def _compact_learning_log(self):
+        """Replace the log with the records still in memory"""
+        temp_file = self.data_file + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.write(''.join(_dumps_json(record) + '\n' for record in self.learning_data))
+        os.replace(temp_file, self.data_file)
+        self._logged_records = len(self.learning_data)
+    
     def get_learning_stats(self) -> Dict[str, Any]:
         """Get learning statistics"""
         if not self.learning_data:
             return {"message": "No learning data available"}
         
-        recent_data = self.learning_data[-100:]  # Last 100 analyses
+        # Stats get polled far more often than we learn something new
+        if self._stats_cache is not None and self._stats_cache[0] == self._stats_version:
+            return dict(self._stats_cache[1])
         
-        return {
+        recent_data = _newest(self.learning_data, 100)  # Last 100 analyses
+        
+        stats = {
             "total_analyses": len(self.learning_data),
             "recent_analyses": len(recent_data),
             "learned_patterns": len(self.pattern_weights),
@@ -2326,8 +2657,10 @@ class LearningAgent(BaseAIAgent):
             "average_score": sum(d['score'] for d in recent_data) / len(recent_data),
             "confidence_trend": sum(d['confidence'] for d in recent_data) / len(recent_data),
             "most_common_tech": Counter([tech for d in recent_data for tech in d['technology_stack']]).most_common(5),
-            "pattern_weights": dict(sorted(self.pattern_weights.items(), key=lambda x: abs(x[1]), reverse=True)[:10])
+            "pattern_weights": dict(heapq.nlargest(10, self.pattern_weights.items(), key=lambda x: abs(x[1])))
         }
+        self._stats_cache = (self._stats_version, stats)
+        return dict(stats)
     
     def _generate_learning_scoring_explanation(self, score: float, features: Dict[str, Any], pattern_insights: List[str]) -> str:
         """Generate human-friendly explanation of learning-based scoring"""
@@ -2393,6 +2726,330 @@ class LearningAgent(BaseAIAgent):
 
 # Specialized AI agents for advanced analysis
 
+# README extraction patterns, compiled once at import instead of on every call.
+# Flags mirror what each extractor historically passed to re.search/re.findall.
+_SECTION_FLAGS = re.DOTALL | re.IGNORECASE
+
+# Text up to the next newline or full stop. Equivalent to the old lazy
+# `(.+?)(?=\n|\.)` / `(.*?)(?=\n|\.)` tails, but a greedy negated class never
+# re-tests the lookahead after every character.
+_CLAUSE = r'(.[^\n.]*)(?=[\n.])'
+_OPTIONAL_CLAUSE = r'([^\n.]*)(?=[\n.])'
+
+# Head words of the README patterns below: the literal word every match of a pattern starts
+# with (after any '## '). One case-insensitive sweep for the heads then tells which patterns
+# can match a README at all. Patterns built with plain re.compile have no head and are always tried.
+_README_PATTERN_HEADS: Dict[re.Pattern, str] = {}
+
+
+def _headed_pattern(head: str, source: str, flags: int = 0) -> re.Pattern:
+    """Compile a README pattern and record the literal word every match of it starts with"""
+    literal = source[len(r'##\s*'):] if source.startswith(r'##\s*') else source
+    if not literal.lower().startswith(head) or literal[len(head):len(head) + 1] in ('?', '*', '{'):
+        raise ValueError(f"README pattern {source!r} doesn't start with the required word {head!r}")
+    pattern = re.compile(source, flags)
+    _README_PATTERN_HEADS[pattern] = head
+    return pattern
+
+
+_SUMMARY_PATTERNS = (
+    _headed_pattern('about', r'##\s*About.*?\n(.*?)(?=\n##|\n#|\Z)', _SECTION_FLAGS),
+    _headed_pattern('project', r'##\s*Project.*?\n(.*?)(?=\n##|\n#|\Z)', _SECTION_FLAGS),
+    _headed_pattern('description', r'##\s*Description.*?\n(.*?)(?=\n##|\n#|\Z)', _SECTION_FLAGS),
+    re.compile(r'^#\s*.*?\n(.*?)(?=\n##|\n#|\Z)', _SECTION_FLAGS),
+)
+
+_PROBLEM_PATTERNS = (
+    _headed_pattern('problem', r'##\s*Problem.*?\n(.*?)(?=\n##|\n#|\Z)', _SECTION_FLAGS),
+    _headed_pattern('challenge', r'##\s*Challenge.*?\n(.*?)(?=\n##|\n#|\Z)', _SECTION_FLAGS),
+    _headed_pattern('issue', r'##\s*Issue.*?\n(.*?)(?=\n##|\n#|\Z)', _SECTION_FLAGS),
+    _headed_pattern('problem', r'problem[s]?\s+is\s+' + _OPTIONAL_CLAUSE, _SECTION_FLAGS),
+    _headed_pattern('challenge', r'challenge[s]?\s+is\s+' + _OPTIONAL_CLAUSE, _SECTION_FLAGS),
+)
+
+_BULLET_PATTERNS = (
+    re.compile(r'[-*]\s+(.+?)(?=\n[-*]|\n\n|\Z)', re.MULTILINE),
+    re.compile(r'\d+\.\s+(.+?)(?=\n\d+\.|\n\n|\Z)', re.MULTILINE),
+)
+
+_COMPARATOR_PATTERNS = (
+    _headed_pattern('vs', r'vs\.?\s+' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('compared', r'compared\s+to\s+' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('unlike', r'unlike\s+' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('similar', r'similar\s+to\s+' + _CLAUSE, re.IGNORECASE),
+)
+
+_CONSTRAINT_PATTERNS = (
+    _headed_pattern('constraint', r'constraint[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('limitation', r'limitation[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('requirement', r'requirement[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('time', r'time\s+limit[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+)
+
+_USER_FLOW_PATTERNS = (
+    _headed_pattern('user', r'user\s+can\s+' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('flow', r'flow[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('step', r'step[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+)
+
+_API_PATTERNS = (
+    _headed_pattern('get', r'GET\s+/(.+)', re.MULTILINE),
+    _headed_pattern('post', r'POST\s+/(.+)', re.MULTILINE),
+    _headed_pattern('put', r'PUT\s+/(.+)', re.MULTILINE),
+    _headed_pattern('delete', r'DELETE\s+/(.+)', re.MULTILINE),
+)
+
+_LIMITATION_PATTERNS = (
+    _headed_pattern('limitation', r'limitation[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('known', r'known\s+issue[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('todo', r'todo[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('not', r'not\s+implemented\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+)
+
+_FLOW_PATTERNS = (
+    _headed_pattern('data', r'data\s+flow[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('pipeline', r'pipeline[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('processing', r'processing\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+)
+
+_PERF_PATTERNS = (
+    _headed_pattern('cache', r'cache[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('queue', r'queue[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('async', r'async[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('scalability', r'scalability\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+)
+
+_SEC_PATTERNS = (
+    _headed_pattern('auth', r'auth[entication]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('security', r'security\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('jwt', r'jwt\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('oauth', r'oauth\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+)
+
+_ROUTE_PATTERNS = (
+    _headed_pattern('page', r'page[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('route', r'route[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('screen', r'screen[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+)
+
+_COPY_PATTERNS = (
+    _headed_pattern('button', r'button[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('heading', r'heading[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+    _headed_pattern('title', r'title[s]?\s*:?\s*' + _CLAUSE, re.IGNORECASE),
+)
+
+
+# '## Heading' keywords read by the extractors. Each is its own group so a match names its
+# key whatever its case; the spellings are the ones the original per-heading patterns used.
+_SECTION_HEADINGS = ('Architecture', 'Design', 'Structure', 'System', 'Theme', 'Brand', 'UI')
+_SECTION_KEYS = tuple(heading.lower() for heading in _SECTION_HEADINGS)
+_SECTION_KEY_RE = re.compile('|'.join(f'({heading})' for heading in _SECTION_HEADINGS), re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_sections(readme: str) -> Dict[str, str]:
+    """Map each known heading keyword to the body of its first section, in one pass over the README.
+
+    A heading is '##', optional whitespace and the keyword, anywhere in the text; its body runs
+    from the next line up to the next line starting with '#'. Only '##' occurrences are visited,
+    and the boundaries are found with str.find.
+    """
+    sections = {}
+    length = len(readme)
+    i = readme.find('##')
+    while i != -1:
+        j = i + 2
+        while j < length and readme[j].isspace():
+            j += 1
+        match = _SECTION_KEY_RE.match(readme, j)
+        if match:
+            key = _SECTION_KEYS[match.lastindex - 1]
+            newline = readme.find('\n', match.end())
+            if key not in sections and newline != -1:
+                start = newline + 1
+                end = readme.find('\n#', start)
+                sections[key] = readme[start:end if end != -1 else length]
+        i = readme.find('##', i + 1)
+    return sections
+
+
+def _first_captures(patterns, text: str, limit: int) -> List[str]:
+    """First `limit` captures of the patterns, in pattern order, without scanning for more"""
+    captures = (match.group(1) for pattern in patterns for match in pattern.finditer(text))
+    return list(itertools.islice(captures, limit))
+
+
+_README_HEADS = set(_README_PATTERN_HEADS.values())
+_README_HEAD_SCANNER = _compile_keywords(_README_HEADS, re.IGNORECASE)
+_README_HEAD_MATCHERS = {head: re.compile(re.escape(head), re.IGNORECASE) for head in _README_HEADS}
+
+
+@functools.lru_cache(maxsize=32)
+def _readme_heads(readme: str) -> frozenset:
+    """Pattern heads that occur in the README, found in a single pass"""
+    hits = set(_README_HEAD_SCANNER.findall(readme))
+    # A reported hit also stands for any shorter head it starts with
+    return frozenset(
+        head for head, matcher in _README_HEAD_MATCHERS.items()
+        if any(matcher.match(hit) for hit in hits)
+    )
+
+
+def _live_patterns(patterns, readme: str) -> Tuple[re.Pattern, ...]:
+    """The patterns that can match the README; the rest are skipped without scanning it"""
+    heads = _readme_heads(readme)
+    return tuple(
+        pattern for pattern in patterns
+        if pattern not in _README_PATTERN_HEADS or _README_PATTERN_HEADS[pattern] in heads
+    )
+
+
+# Tech stack detection tables shared by the specialized agents
+_EXT_TO_TECH = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.jsx': 'React',
+    '.tsx': 'React TypeScript',
+    '.vue': 'Vue.js',
+    '.java': 'Java',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.cpp': 'C++',
+    '.php': 'PHP',
+    '.rb': 'Ruby',
+    '.swift': 'Swift',
+    '.kt': 'Kotlin',
+    '.html': 'HTML',
+    '.css': 'CSS',
+    '.scss': 'SCSS',
+    '.sass': 'Sass',
+}
+
+_TECHNICAL_EXT_TO_TECH = {
+    **_EXT_TO_TECH,
+    '.sql': 'SQL',
+    '.json': 'JSON',
+    '.yaml': 'YAML',
+    '.yml': 'YAML',
+    '.toml': 'TOML',
+    '.xml': 'XML',
+}
+
+_FRAMEWORK_KEYWORDS = ('react', 'vue', 'angular', 'django', 'flask', 'express', 'spring', 'rails', 'laravel')
+_TECHNICAL_FRAMEWORK_KEYWORDS = _FRAMEWORK_KEYWORDS + ('fastapi', 'nextjs', 'nuxt')
+_DATABASE_KEYWORDS = ('postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch', 'cassandra')
+_CLOUD_KEYWORDS = ('aws', 'azure', 'gcp', 'heroku', 'vercel', 'netlify')
+
+# README labels are built at runtime, so intern them - that way a technology found via both
+# files and the README is one string object (identifier-like literals above already are)
+_README_TECH_LABELS = {kw: sys.intern(kw.title()) for kw in _TECHNICAL_FRAMEWORK_KEYWORDS + _DATABASE_KEYWORDS}
+_README_TECH_LABELS.update({kw: sys.intern(kw.upper()) for kw in _CLOUD_KEYWORDS})
+
+_HIGH_COMPLEXITY_STYLES = frozenset({'Microservices', 'Event-driven', 'Distributed'})
+
+_FRAMEWORK_SCANNER = _compile_keywords(_FRAMEWORK_KEYWORDS)
+_TECHNICAL_TECH_SCANNER = _compile_keywords(
+    _TECHNICAL_FRAMEWORK_KEYWORDS + _DATABASE_KEYWORDS + _CLOUD_KEYWORDS
+)
+
+
+# File path keywords, matched against lowercased paths. Case-sensitive alternations over
+# lowered text keep re's literal-prefix search, which re.IGNORECASE disables.
+_DATA_FILE_RE = re.compile(r'pipeline|processor|etl|transform|model')
+_PERF_FILE_RE = re.compile(r'cache|redis|queue|worker|async|batch|index')
+_SEC_FILE_RE = re.compile(r'auth|security|jwt|oauth|middleware|guard|permission')
+_FEATURE_FILE_RE = re.compile(r'feature|component|module|service')
+_FLOW_FILE_RE = re.compile(r'route|controller|handler|api')
+_ENDPOINT_FILE_RE = re.compile(r'route|api|endpoint|controller')
+_DEPLOY_FILE_RE = re.compile(r'dockerfile|docker-compose|deploy|ci|github')
+
+
+_UI_EXTS = frozenset({'.html', '.jsx', '.tsx', '.vue', '.svelte'})
+_UI_ASSET_EXTS = _UI_EXTS | {'.css', '.scss', '.sass'}
+_CODE_EXTS = frozenset({'.py', '.js', '.ts', '.java', '.go', '.rs', '.cpp', '.c', '.php', '.rb', '.swift', '.kt'})
+
+
+# Technical complexity drivers: (input key, minimum item count, description, score points).
+# Every driver is worth 2 points; documented architecture, flows and signals earn 1 more.
+_COMPLEXITY_DRIVERS = (
+    ('tech_stack_detected', 6, "Multi-technology stack: {n} technologies", 2),
+    ('architecture_notes', 1, "Architecture documented with design decisions", 3),
+    ('data_flows', 1, "Data processing pipelines: {n} flows", 3),
+    ('performance_scalability_signals', 1, "Performance optimization: {n} signals", 3),
+    ('security_privacy_signals', 1, "Security implementation: {n} components", 3),
+)
+
+
+class FileTreeSignals:
+    """What the specialized agents read off a file tree.
+
+    Extensions and UI pages come from one walk over the blobs. Each keyword bucket is
+    filled the first time an agent asks for it, by one regex scan over all lowercased
+    paths joined together, so agents sharing this object never classify a path twice.
+    """
+    
+    def __init__(self, files: FileTreeColumns):
+        # Reuse the shared columns' lowercased paths rather than lowering every blob again
+        is_blob = [file_type == 'blob' for file_type in files.types]
+        self.paths = list(itertools.compress(files.paths, is_blob))
+        lowered = list(itertools.compress(files.paths_lower, is_blob))
+        self.exts = {}  # insertion-ordered set
+        self.ui_pages = []
+        
+        for path in self.paths:
+            ext = path[path.rfind('.'):]
+            self.exts[ext] = None
+            if ext in _UI_EXTS:
+                # Page name is the file name up to its first dot
+                page_name = path[path.rfind('/') + 1:].partition('.')[0]
+                self.ui_pages.append(page_name.title())
+        
+        self._joined = '\n'.join(lowered)
+        self._offsets = np.cumsum([0] + [len(path) + 1 for path in lowered[:-1]])
+    
+    def tech(self, ext_to_tech: Dict[str, str]) -> Dict[str, None]:
+        """Technologies for the tree's extensions, in first-seen order, as an insertion-ordered set"""
+        return dict.fromkeys(ext_to_tech[ext] for ext in self.exts if ext in ext_to_tech)
+    
+    def _matching(self, regex: re.Pattern) -> List[str]:
+        """Paths whose lowercased form contains a match of regex"""
+        starts = np.fromiter((match.start() for match in regex.finditer(self._joined)), dtype=np.int64)
+        if not starts.size:
+            return []
+        # Keywords never contain a newline, so every match lies inside a single path
+        indices = np.unique(np.searchsorted(self._offsets, starts, side='right') - 1)
+        return [self.paths[i] for i in indices]
+    
+    @functools.cached_property
+    def data_files(self) -> List[str]:
+        return self._matching(_DATA_FILE_RE)
+    
+    @functools.cached_property
+    def perf_files(self) -> List[str]:
+        return self._matching(_PERF_FILE_RE)
+    
+    @functools.cached_property
+    def sec_files(self) -> List[str]:
+        return self._matching(_SEC_FILE_RE)
+    
+    @functools.cached_property
+    def feature_files(self) -> List[str]:
+        return self._matching(_FEATURE_FILE_RE)
+    
+    @functools.cached_property
+    def flow_files(self) -> List[str]:
+        return self._matching(_FLOW_FILE_RE)
+    
+    @functools.cached_property
+    def endpoint_files(self) -> List[str]:
+        return self._matching(_ENDPOINT_FILE_RE)
+    
+    @functools.cached_property
+    def deploy_files(self) -> List[str]:
+        return self._matching(_DEPLOY_FILE_RE)
+
+
 class BaseSpecializedAgent(ABC):
     """Base class for specialized AI agents"""
     
@@ -2416,6 +3073,34 @@ class BaseSpecializedAgent(ABC):
     def _simulate_analysis(self, inputs_dict: Dict[str, Any]) -> Dict[str, Any]:
         """Simulate analysis for demonstration purposes"""
         pass
+    
+    @abstractmethod
+    def _extract_inputs(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract relevant inputs from context"""
+        pass
+    
+    def _get_inputs(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract inputs once per context, re-using them when the same repo is analyzed again"""
+        cache = context.setdefault('_extractor_cache', {})
+        readme = context.get('readme', '')
+        file_tree = context.get('file_tree', [])
+        
+        entry = cache.get(self.name)
+        if entry is None or entry[0] is not readme or entry[1] is not file_tree:
+            entry = cache[self.name] = (readme, file_tree, self._extract_inputs(context))
+        
+        # Callers may add keys to their inputs, so hand out a copy
+        return dict(entry[2])
+    
+    def _get_file_tree_signals(self, context: Dict[str, Any]) -> FileTreeSignals:
+        """Scan the context's file tree once for all specialized agents"""
+        cache = context.setdefault('_extractor_cache', {})
+        file_tree = context.get('file_tree', [])
+        
+        entry = cache.get('file_tree_signals')
+        if entry is None or entry[0] is not file_tree:
+            entry = cache['file_tree_signals'] = (file_tree, FileTreeSignals(_get_file_columns(context)))
+        return entry[1]
 
 
 class InnovationCreativityAgent(BaseSpecializedAgent):
@@ -2484,7 +3169,7 @@ If project_summary and features_list are both present, +0.1 (cap at 1.0).
     def analyze(self, context: Dict[str, Any]) -> AgentAnalysis:
         """Analyze innovation and creativity aspects"""
         # Extract inputs from context
-        inputs_dict = self._extract_inputs(context)
+        inputs_dict = self._get_inputs(context)
         
         # Run the agent analysis
         result = self.run_agent(None, inputs_dict)
@@ -2546,11 +3231,13 @@ If project_summary and features_list are both present, +0.1 (cap at 1.0).
         # Extract problem statement
         problem_statement = self._extract_problem_statement(readme)
         
+        tree_signals = self._get_file_tree_signals(context)
+        
         # Extract features list
-        features_list = self._extract_features_list(readme, file_tree)
+        features_list = self._extract_features_list(readme, tree_signals)
         
         # Detect tech stack
-        tech_stack_detected = self._detect_tech_stack(file_tree, readme)
+        tech_stack_detected = self._detect_tech_stack(tree_signals, _get_readme_lower(context))
         
         # Extract comparator landscape
         comparator_landscape = self._extract_comparator_landscape(readme)
@@ -2577,15 +3264,8 @@ If project_summary and features_list are both present, +0.1 (cap at 1.0).
             return ""
         
         # Look for common patterns
-        patterns = [
-            r'##\s*About.*?\n(.*?)(?=\n##|\n#|\Z)',
-            r'##\s*Project.*?\n(.*?)(?=\n##|\n#|\Z)',
-            r'##\s*Description.*?\n(.*?)(?=\n##|\n#|\Z)',
-            r'^#\s*.*?\n(.*?)(?=\n##|\n#|\Z)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, readme, re.DOTALL | re.IGNORECASE)
+        for pattern in _live_patterns(_SUMMARY_PATTERNS, readme):
+            match = pattern.search(readme)
             if match:
                 summary = match.group(1).strip()
                 if len(summary) > 50:  # Ensure it's substantial
@@ -2604,88 +3284,37 @@ If project_summary and features_list are both present, +0.1 (cap at 1.0).
         if not readme:
             return ""
         
-        patterns = [
-            r'##\s*Problem.*?\n(.*?)(?=\n##|\n#|\Z)',
-            r'##\s*Challenge.*?\n(.*?)(?=\n##|\n#|\Z)',
-            r'##\s*Issue.*?\n(.*?)(?=\n##|\n#|\Z)',
-            r'problem[s]?\s+is\s+(.*?)(?=\n|\.)',
-            r'challenge[s]?\s+is\s+(.*?)(?=\n|\.)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, readme, re.DOTALL | re.IGNORECASE)
+        for pattern in _live_patterns(_PROBLEM_PATTERNS, readme):
+            match = pattern.search(readme)
             if match:
                 return match.group(1).strip()[:300]
         
         return ""
     
-    def _extract_features_list(self, readme: str, file_tree: List[Dict]) -> List[str]:
+    def _extract_features_list(self, readme: str, tree_signals: FileTreeSignals) -> List[str]:
         """Extract features list from README and file structure"""
         features = []
         
         if readme:
             # Look for bullet points or numbered lists
-            bullet_patterns = [
-                r'[-*]\s+(.+?)(?=\n[-*]|\n\n|\Z)',
-                r'\d+\.\s+(.+?)(?=\n\d+\.|\n\n|\Z)'
-            ]
-            
-            for pattern in bullet_patterns:
-                matches = re.findall(pattern, readme, re.MULTILINE)
-                features.extend([match.strip() for match in matches[:10]])
+            features.extend(match.strip() for match in _first_captures(_BULLET_PATTERNS, readme, 10))
         
         # Extract features from file structure
-        feature_files = ['feature', 'component', 'module', 'service']
-        for file_info in file_tree:
-            if file_info.get('type') == 'blob':
-                path = file_info.get('path', '').lower()
-                if any(f in path for f in feature_files):
-                    features.append(f"Feature: {file_info.get('path')}")
+        features.extend(f"Feature: {path}" for path in tree_signals.feature_files)
         
         return features[:10]  # Limit to 10 features
     
-    def _detect_tech_stack(self, file_tree: List[Dict], readme: str) -> List[str]:
+    def _detect_tech_stack(self, tree_signals: FileTreeSignals, readme_lower: str) -> List[str]:
         """Detect technology stack from files and README"""
-        tech_stack = []
-        
         # File-based detection
-        tech_mapping = {
-            '.py': 'Python',
-            '.js': 'JavaScript',
-            '.ts': 'TypeScript',
-            '.jsx': 'React',
-            '.tsx': 'React TypeScript',
-            '.vue': 'Vue.js',
-            '.java': 'Java',
-            '.go': 'Go',
-            '.rs': 'Rust',
-            '.cpp': 'C++',
-            '.php': 'PHP',
-            '.rb': 'Ruby',
-            '.swift': 'Swift',
-            '.kt': 'Kotlin',
-            '.html': 'HTML',
-            '.css': 'CSS',
-            '.scss': 'SCSS',
-            '.sass': 'Sass'
-        }
-        
-        for file_info in file_tree:
-            if file_info.get('type') == 'blob':
-                path = file_info.get('path', '')
-                for ext, tech in tech_mapping.items():
-                    if path.endswith(ext):
-                        tech_stack.append(tech)
+        tech_stack = tree_signals.tech(_EXT_TO_TECH)
         
         # README-based detection
-        if readme:
-            readme_lower = readme.lower()
-            frameworks = ['react', 'vue', 'angular', 'django', 'flask', 'express', 'spring', 'rails', 'laravel']
-            for framework in frameworks:
-                if framework in readme_lower:
-                    tech_stack.append(framework.title())
+        if readme_lower:
+            found = set(_FRAMEWORK_SCANNER.findall(readme_lower))
+            tech_stack.update(dict.fromkeys(_README_TECH_LABELS[kw] for kw in _FRAMEWORK_KEYWORDS if kw in found))
         
-        return list(set(tech_stack))  # Remove duplicates
+        return list(tech_stack)
     
     def _extract_comparator_landscape(self, readme: str) -> List[str]:
         """Extract competitor/comparison mentions from README"""
@@ -2693,19 +3322,7 @@ If project_summary and features_list are both present, +0.1 (cap at 1.0).
             return []
         
         # Look for comparison patterns
-        patterns = [
-            r'vs\.?\s+(.+?)(?=\n|\.)',
-            r'compared\s+to\s+(.+?)(?=\n|\.)',
-            r'unlike\s+(.+?)(?=\n|\.)',
-            r'similar\s+to\s+(.+?)(?=\n|\.)'
-        ]
-        
-        comparisons = []
-        for pattern in patterns:
-            matches = re.findall(pattern, readme, re.IGNORECASE)
-            comparisons.extend(matches)
-        
-        return comparisons[:5]  # Limit to 5 comparisons
+        return _first_captures(_live_patterns(_COMPARATOR_PATTERNS, readme), readme, 5)  # Limit to 5 comparisons
     
     def _extract_constraints(self, readme: str, artifacts: Dict) -> List[str]:
         """Extract constraints from README and artifacts"""
@@ -2713,18 +3330,9 @@ If project_summary and features_list are both present, +0.1 (cap at 1.0).
         
         if readme:
             # Look for constraint patterns
-            constraint_patterns = [
-                r'constraint[s]?\s*:?\s*(.+?)(?=\n|\.)',
-                r'limitation[s]?\s*:?\s*(.+?)(?=\n|\.)',
-                r'requirement[s]?\s*:?\s*(.+?)(?=\n|\.)',
-                r'time\s+limit[s]?\s*:?\s*(.+?)(?=\n|\.)'
-            ]
-            
-            for pattern in constraint_patterns:
-                matches = re.findall(pattern, readme, re.IGNORECASE)
-                constraints.extend(matches)
+            constraints = _first_captures(_live_patterns(_CONSTRAINT_PATTERNS, readme), readme, 5)
         
-        return constraints[:5]
+        return constraints
     
     def _simulate_analysis(self, inputs_dict: Dict[str, Any]) -> Dict[str, Any]:
         """Simulate analysis for demonstration purposes"""
@@ -2748,7 +3356,7 @@ If project_summary and features_list are both present, +0.1 (cap at 1.0).
         aha_factor = min(7, len(features_list))
         future_potential = min(6, len(tech_stack))
         
-        overall = int((originality + creative_tech_use + problem_fit + aha_factor + future_potential) / 5)
+        overall = (originality + creative_tech_use + problem_fit + aha_factor + future_potential) // 5
         
         # Calculate confidence
         evidence_count = len(evidence_points)
@@ -2978,7 +3586,7 @@ Cap at 1.0.
     
     def analyze(self, context: Dict[str, Any]) -> AgentAnalysis:
         """Analyze functionality and completeness"""
-        inputs_dict = self._extract_inputs(context)
+        inputs_dict = self._get_inputs(context)
         result = self.run_agent(None, inputs_dict)
         
         # Normalize score to 0-10
@@ -3040,13 +3648,13 @@ Cap at 1.0.
         features_list = self._extract_features_list(readme, file_tree)
         
         # Extract user flows
-        user_flows = self._extract_user_flows(readme, file_tree)
+        user_flows = self._extract_user_flows(readme, self._get_file_tree_signals(context))
         
         # Extract demo reference
         demo_reference = artifacts.get('screenshots_or_demo', '')
         
         # Extract API endpoints
-        api_endpoints = self._extract_api_endpoints(file_tree, readme)
+        api_endpoints = self._extract_api_endpoints(self._get_file_tree_signals(context), readme)
         
         # Extract test summary
         test_summary = artifacts.get('test_results', '')
@@ -3055,7 +3663,7 @@ Cap at 1.0.
         known_limitations = self._extract_limitations(readme)
         
         # Extract deployment info
-        env_and_deploy = self._extract_deployment_info(file_tree, readme)
+        env_and_deploy = self._extract_deployment_info(self._get_file_tree_signals(context), readme)
         
         return {
             'features_list': features_list,
@@ -3073,65 +3681,32 @@ Cap at 1.0.
         
         if readme:
             # Look for bullet points or numbered lists
-            bullet_patterns = [
-                r'[-*]\s+(.+?)(?=\n[-*]|\n\n|\Z)',
-                r'\d+\.\s+(.+?)(?=\n\d+\.|\n\n|\Z)'
-            ]
-            
-            for pattern in bullet_patterns:
-                matches = re.findall(pattern, readme, re.MULTILINE)
-                features.extend([match.strip() for match in matches[:10]])
+            features.extend(match.strip() for match in _first_captures(_BULLET_PATTERNS, readme, 10))
         
         return features[:10]
     
-    def _extract_user_flows(self, readme: str, file_tree: List[Dict]) -> List[str]:
+    def _extract_user_flows(self, readme: str, tree_signals: FileTreeSignals) -> List[str]:
         """Extract user flows from README and file structure"""
         flows = []
         
         if readme:
             # Look for flow patterns
-            flow_patterns = [
-                r'user\s+can\s+(.+?)(?=\n|\.)',
-                r'flow[s]?\s*:?\s*(.+?)(?=\n|\.)',
-                r'step[s]?\s*:?\s*(.+?)(?=\n|\.)'
-            ]
-            
-            for pattern in flow_patterns:
-                matches = re.findall(pattern, readme, re.IGNORECASE)
-                flows.extend([match.strip() for match in matches[:10]])
+            flows.extend(match.strip() for match in _first_captures(_live_patterns(_USER_FLOW_PATTERNS, readme), readme, 10))
         
         # Extract from file structure
-        flow_files = ['route', 'controller', 'handler', 'api']
-        for file_info in file_tree:
-            if file_info.get('type') == 'blob':
-                path = file_info.get('path', '').lower()
-                if any(f in path for f in flow_files):
-                    flows.append(f"API endpoint: {file_info.get('path')}")
+        flows.extend(_make_evidence(_API_ENDPOINT_PREFIX, path) for path in tree_signals.flow_files)
         
         return flows[:10]
     
-    def _extract_api_endpoints(self, file_tree: List[Dict], readme: str) -> List[str]:
+    def _extract_api_endpoints(self, tree_signals: FileTreeSignals, readme: str) -> List[str]:
         """Extract API endpoints from file structure and README"""
-        endpoints = []
-        
         # Look for route files
-        for file_info in file_tree:
-            if file_info.get('type') == 'blob':
-                path = file_info.get('path', '')
-                if any(keyword in path.lower() for keyword in ['route', 'api', 'endpoint', 'controller']):
-                    endpoints.append(f"Route file: {path}")
+        endpoints = [_make_evidence(_ROUTE_PREFIX, path) for path in tree_signals.endpoint_files]
         
         # Look for API documentation in README
         if readme:
-            api_patterns = [
-                r'GET\s+/(.+?)(?=\n|$)',
-                r'POST\s+/(.+?)(?=\n|$)',
-                r'PUT\s+/(.+?)(?=\n|$)',
-                r'DELETE\s+/(.+?)(?=\n|$)'
-            ]
-            
-            for pattern in api_patterns:
-                matches = re.findall(pattern, readme, re.MULTILINE)
+            for pattern in _live_patterns(_API_PATTERNS, readme):
+                matches = pattern.findall(readme)
                 endpoints.extend([f"API: {match.strip()}" for match in matches[:5]])
         
         return endpoints[:10]
@@ -3141,33 +3716,17 @@ Cap at 1.0.
         if not readme:
             return []
         
-        limitation_patterns = [
-            r'limitation[s]?\s*:?\s*(.+?)(?=\n|\.)',
-            r'known\s+issue[s]?\s*:?\s*(.+?)(?=\n|\.)',
-            r'todo[s]?\s*:?\s*(.+?)(?=\n|\.)',
-            r'not\s+implemented\s*:?\s*(.+?)(?=\n|\.)'
-        ]
-        
         limitations = []
-        for pattern in limitation_patterns:
-            matches = re.findall(pattern, readme, re.IGNORECASE)
+        for pattern in _live_patterns(_LIMITATION_PATTERNS, readme):
+            matches = pattern.findall(readme)
             limitations.extend([match.strip() for match in matches[:5]])
         
         return limitations
     
-    def _extract_deployment_info(self, file_tree: List[Dict], readme: str) -> List[str]:
+    def _extract_deployment_info(self, tree_signals: FileTreeSignals, readme: str) -> List[str]:
         """Extract deployment information"""
-        deploy_info = []
-        
         # Look for deployment files
-        deploy_files = ['dockerfile', 'docker-compose', 'deploy', 'ci', 'github']
-        for file_info in file_tree:
-            if file_info.get('type') == 'blob':
-                path = file_info.get('path', '').lower()
-                if any(f in path for f in deploy_files):
-                    deploy_info.append(f"Deployment file: {file_info.get('path')}")
-        
-        return deploy_info
+        return [_make_evidence(_DEPLOYMENT_PREFIX, path) for path in tree_signals.deploy_files]
     
     def _simulate_analysis(self, inputs_dict: Dict[str, Any]) -> Dict[str, Any]:
         """Simulate analysis for demonstration purposes"""
@@ -3373,7 +3932,7 @@ tech_stack_detected + performance_scalability_signals + security_privacy_signals
     
     def analyze(self, context: Dict[str, Any]) -> AgentAnalysis:
         """Analyze technical complexity"""
-        inputs_dict = self._extract_inputs(context)
+        inputs_dict = self._get_inputs(context)
         result = self.run_agent(None, inputs_dict)
         
         # Normalize score to 0-10
@@ -3433,26 +3992,28 @@ tech_stack_detected + performance_scalability_signals + security_privacy_signals
     def _extract_inputs(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Extract relevant inputs from context"""
         readme = context.get('readme', '')
-        file_tree = context.get('file_tree', [])
         artifacts = context.get('artifacts', {})
         
+        # One walk over the file tree feeds every file-based extractor below
+        tree_signals = self._get_file_tree_signals(context)
+        
         # Detect tech stack
-        tech_stack_detected = self._detect_tech_stack(file_tree, readme)
+        tech_stack_detected = self._detect_tech_stack(tree_signals, _get_readme_lower(context))
         
         # Extract architecture notes
         architecture_notes = self._extract_architecture_notes(readme)
         
         # Extract data flows
-        data_flows = self._extract_data_flows(readme, file_tree)
+        data_flows = self._extract_data_flows(readme, tree_signals)
         
         # Extract constraints
         constraints = self._extract_constraints(readme, artifacts)
         
         # Extract performance/scalability signals
-        performance_signals = self._extract_performance_signals(file_tree, readme)
+        performance_signals = self._extract_performance_signals(tree_signals, readme)
         
         # Extract security/privacy signals
-        security_signals = self._extract_security_signals(file_tree, readme)
+        security_signals = self._extract_security_signals(tree_signals, readme)
         
         return {
             'tech_stack_detected': tech_stack_detected,
@@ -3463,108 +4024,44 @@ tech_stack_detected + performance_scalability_signals + security_privacy_signals
             'security_privacy_signals': security_signals
         }
     
-    def _detect_tech_stack(self, file_tree: List[Dict], readme: str) -> List[str]:
+    def _detect_tech_stack(self, tree_signals: FileTreeSignals, readme_lower: str) -> List[str]:
         """Detect technology stack from files and README"""
-        tech_stack = []
-        
         # File-based detection
-        tech_mapping = {
-            '.py': 'Python',
-            '.js': 'JavaScript',
-            '.ts': 'TypeScript',
-            '.jsx': 'React',
-            '.tsx': 'React TypeScript',
-            '.vue': 'Vue.js',
-            '.java': 'Java',
-            '.go': 'Go',
-            '.rs': 'Rust',
-            '.cpp': 'C++',
-            '.php': 'PHP',
-            '.rb': 'Ruby',
-            '.swift': 'Swift',
-            '.kt': 'Kotlin',
-            '.html': 'HTML',
-            '.css': 'CSS',
-            '.scss': 'SCSS',
-            '.sass': 'Sass',
-            '.sql': 'SQL',
-            '.json': 'JSON',
-            '.yaml': 'YAML',
-            '.yml': 'YAML',
-            '.toml': 'TOML',
-            '.xml': 'XML'
-        }
-        
-        for file_info in file_tree:
-            if file_info.get('type') == 'blob':
-                path = file_info.get('path', '')
-                for ext, tech in tech_mapping.items():
-                    if path.endswith(ext):
-                        tech_stack.append(tech)
-        
-        # README-based detection
-        if readme:
-            readme_lower = readme.lower()
-            frameworks = ['react', 'vue', 'angular', 'django', 'flask', 'express', 'spring', 'rails', 'laravel', 'fastapi', 'nextjs', 'nuxt']
-            databases = ['postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch', 'cassandra']
-            cloud = ['aws', 'azure', 'gcp', 'heroku', 'vercel', 'netlify']
-            
-            for framework in frameworks:
-                if framework in readme_lower:
-                    tech_stack.append(framework.title())
-            
-            for db in databases:
-                if db in readme_lower:
-                    tech_stack.append(db.title())
-            
-            for cloud_provider in cloud:
-                if cloud_provider in readme_lower:
-                    tech_stack.append(cloud_provider.upper())
-        
-        return list(set(tech_stack))  # Remove duplicates
+        tech_stack = tree_signals.tech(_TECHNICAL_EXT_TO_TECH)
+        
+        # README-based detection: one pass over the README for every keyword
+        if readme_lower:
+            found = set(_TECHNICAL_TECH_SCANNER.findall(readme_lower))
+            tech_stack.update(dict.fromkeys(
+                _README_TECH_LABELS[kw]
+                for kw in _TECHNICAL_FRAMEWORK_KEYWORDS + _DATABASE_KEYWORDS + _CLOUD_KEYWORDS
+                if kw in found
+            ))
+        
+        return list(tech_stack)
     
     def _extract_architecture_notes(self, readme: str) -> str:
         """Extract architecture notes from README"""
         if not readme:
             return ""
         
-        patterns = [
-            r'##\s*Architecture.*?\n(.*?)(?=\n##|\n#|\Z)',
-            r'##\s*Design.*?\n(.*?)(?=\n##|\n#|\Z)',
-            r'##\s*Structure.*?\n(.*?)(?=\n##|\n#|\Z)',
-            r'##\s*System.*?\n(.*?)(?=\n##|\n#|\Z)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, readme, re.DOTALL | re.IGNORECASE)
-            if match:
-                return match.group(1).strip()[:500]
+        sections = _parse_sections(readme)
+        for key in ('architecture', 'design', 'structure', 'system'):
+            if key in sections:
+                return sections[key].strip()[:500]
         
         return ""
     
-    def _extract_data_flows(self, readme: str, file_tree: List[Dict]) -> List[str]:
+    def _extract_data_flows(self, readme: str, tree_signals: FileTreeSignals) -> List[str]:
         """Extract data flow descriptions"""
         flows = []
         
         if readme:
             # Look for data flow patterns
-            flow_patterns = [
-                r'data\s+flow[s]?\s*:?\s*(.+?)(?=\n|\.)',
-                r'pipeline[s]?\s*:?\s*(.+?)(?=\n|\.)',
-                r'processing\s*:?\s*(.+?)(?=\n|\.)'
-            ]
-            
-            for pattern in flow_patterns:
-                matches = re.findall(pattern, readme, re.IGNORECASE)
-                flows.extend([match.strip() for match in matches[:5]])
+            flows.extend(match.strip() for match in _first_captures(_live_patterns(_FLOW_PATTERNS, readme), readme, 5))
         
         # Look for data processing files
-        data_files = ['pipeline', 'processor', 'etl', 'transform', 'model']
-        for file_info in file_tree:
-            if file_info.get('type') == 'blob':
-                path = file_info.get('path', '').lower()
-                if any(f in path for f in data_files):
-                    flows.append(f"Data processing: {file_info.get('path')}")
+        flows.extend(f"Data processing: {path}" for path in tree_signals.data_files)
         
         return flows[:5]
     
@@ -3573,69 +4070,34 @@ tech_stack_detected + performance_scalability_signals + security_privacy_signals
         constraints = []
         
         if readme:
-            constraint_patterns = [
-                r'constraint[s]?\s*:?\s*(.+?)(?=\n|\.)',
-                r'limitation[s]?\s*:?\s*(.+?)(?=\n|\.)',
-                r'requirement[s]?\s*:?\s*(.+?)(?=\n|\.)',
-                r'time\s+limit[s]?\s*:?\s*(.+?)(?=\n|\.)'
-            ]
-            
-            for pattern in constraint_patterns:
-                matches = re.findall(pattern, readme, re.IGNORECASE)
+            for pattern in _live_patterns(_CONSTRAINT_PATTERNS, readme):
+                matches = pattern.findall(readme)
                 constraints.extend([match.strip() for match in matches[:5]])
         
         return constraints
     
-    def _extract_performance_signals(self, file_tree: List[Dict], readme: str) -> List[str]:
+    def _extract_performance_signals(self, tree_signals: FileTreeSignals, readme: str) -> List[str]:
         """Extract performance and scalability signals"""
-        signals = []
-        
         # Look for performance-related files
-        perf_files = ['cache', 'redis', 'queue', 'worker', 'async', 'batch', 'index']
-        for file_info in file_tree:
-            if file_info.get('type') == 'blob':
-                path = file_info.get('path', '').lower()
-                if any(f in path for f in perf_files):
-                    signals.append(f"Performance file: {file_info.get('path')}")
+        signals = [_make_evidence(_PERFORMANCE_PREFIX, path) for path in tree_signals.perf_files]
         
         # Look for performance mentions in README
         if readme:
-            perf_patterns = [
-                r'cache[s]?\s*:?\s*(.+?)(?=\n|\.)',
-                r'queue[s]?\s*:?\s*(.+?)(?=\n|\.)',
-                r'async[s]?\s*:?\s*(.+?)(?=\n|\.)',
-                r'scalability\s*:?\s*(.+?)(?=\n|\.)'
-            ]
-            
-            for pattern in perf_patterns:
-                matches = re.findall(pattern, readme, re.IGNORECASE)
+            for pattern in _live_patterns(_PERF_PATTERNS, readme):
+                matches = pattern.findall(readme)
                 signals.extend([match.strip() for match in matches[:5]])
         
         return signals
     
-    def _extract_security_signals(self, file_tree: List[Dict], readme: str) -> List[str]:
+    def _extract_security_signals(self, tree_signals: FileTreeSignals, readme: str) -> List[str]:
         """Extract security and privacy signals"""
-        signals = []
-        
         # Look for security-related files
-        security_files = ['auth', 'security', 'jwt', 'oauth', 'middleware', 'guard', 'permission']
-        for file_info in file_tree:
-            if file_info.get('type') == 'blob':
-                path = file_info.get('path', '').lower()
-                if any(f in path for f in security_files):
-                    signals.append(f"Security file: {file_info.get('path')}")
+        signals = [_make_evidence(_SECURITY_PREFIX, path) for path in tree_signals.sec_files]
         
         # Look for security mentions in README
         if readme:
-            security_patterns = [
-                r'auth[entication]?\s*:?\s*(.+?)(?=\n|\.)',
-                r'security\s*:?\s*(.+?)(?=\n|\.)',
-                r'jwt\s*:?\s*(.+?)(?=\n|\.)',
-                r'oauth\s*:?\s*(.+?)(?=\n|\.)'
-            ]
-            
-            for pattern in security_patterns:
-                matches = re.findall(pattern, readme, re.IGNORECASE)
+            for pattern in _live_patterns(_SEC_PATTERNS, readme):
+                matches = pattern.findall(readme)
                 signals.extend([match.strip() for match in matches[:5]])
         
         return signals
@@ -3648,30 +4110,22 @@ tech_stack_detected + performance_scalability_signals + security_privacy_signals
         performance_signals = inputs_dict.get('performance_scalability_signals', [])
         security_signals = inputs_dict.get('security_privacy_signals', [])
         
-        # Calculate complexity drivers
+        # Calculate complexity drivers and the score they earn in one pass
         complexity_drivers = []
-        
-        if len(tech_stack) > 5:
-            complexity_drivers.append(f"Multi-technology stack: {len(tech_stack)} technologies")
-        
-        if architecture_notes:
-            complexity_drivers.append("Architecture documented with design decisions")
-        
-        if data_flows:
-            complexity_drivers.append(f"Data processing pipelines: {len(data_flows)} flows")
-        
-        if performance_signals:
-            complexity_drivers.append(f"Performance optimization: {len(performance_signals)} signals")
-        
-        if security_signals:
-            complexity_drivers.append(f"Security implementation: {len(security_signals)} components")
+        base_score = 0
+        for key, min_count, template, points in _COMPLEXITY_DRIVERS:
+            count = len(inputs_dict.get(key) or ())
+            if count >= min_count:
+                complexity_drivers.append(template.format(n=count))
+                base_score += points
         
         # Determine architecture style
-        if 'microservices' in str(architecture_notes).lower():
+        arch_lower = str(architecture_notes).lower()
+        if 'microservices' in arch_lower:
             architecture_style = "microservices"
-        elif 'event' in str(architecture_notes).lower():
+        elif 'event' in arch_lower:
             architecture_style = "event-driven"
-        elif 'pipeline' in str(data_flows).lower():
+        elif any('pipeline' in flow.lower() for flow in data_flows):
             architecture_style = "data-pipeline"
         elif len(tech_stack) > 3:
             architecture_style = "hybrid"
@@ -3684,20 +4138,13 @@ tech_stack_detected + performance_scalability_signals + security_privacy_signals
         integration_score = min(len(tech_stack) + len(performance_signals) + len(security_signals), 10)
         
         # Calculate overall score
-        base_score = len(complexity_drivers) * 2
-        if architecture_notes:
-            base_score += 1
-        if data_flows:
-            base_score += 1
-        if performance_signals:
-            base_score += 1
-        if security_signals:
-            base_score += 1
-        
         overall_score = min(base_score, 10)
         
         # Calculate confidence
-        distinct_signals = len(set(tech_stack + performance_signals + security_signals))
+        signal_set = set(tech_stack)
+        signal_set.update(performance_signals)
+        signal_set.update(security_signals)
+        distinct_signals = len(signal_set)
         if architecture_notes:
             distinct_signals += 1
         if data_flows:
@@ -3734,51 +4181,51 @@ tech_stack_detected + performance_scalability_signals + security_privacy_signals
         else:
             assessment = "Poor technical complexity requiring architectural improvements"
         
-        explanation = f"Technical Complexity: {overall_score}/10 - {assessment}\n\n"
+        parts = [f"Technical Complexity: {overall_score}/10 - {assessment}\n\n"]
         
         # Why this score is high (if high)
         if overall_score >= 8:
-            explanation += "🎯 Why this score is high:\n"
-            if architecture_style in ['Microservices', 'Event-driven', 'Distributed']:
-                explanation += f"  • Architecture: {architecture_style} - High complexity architecture\n"
+            parts.append("🎯 Why this score is high:\n")
+            if architecture_style in _HIGH_COMPLEXITY_STYLES:
+                parts.append(f"  • Architecture: {architecture_style} - High complexity architecture\n")
             if integration_score >= 7:
-                explanation += f"  • Integration: {integration_score}/10 - Complex integration surface\n"
+                parts.append(f"  • Integration: {integration_score}/10 - Complex integration surface\n")
             if len(complexity_drivers) >= 5:
-                explanation += f"  • Complexity drivers: {len(complexity_drivers)} factors - Multiple complexity factors\n"
+                parts.append(f"  • Complexity drivers: {len(complexity_drivers)} factors - Multiple complexity factors\n")
             if len(tech_stack) >= 5:
-                explanation += f"  • Tech stack: {len(tech_stack)} technologies - High technology diversity\n"
+                parts.append(f"  • Tech stack: {len(tech_stack)} technologies - High technology diversity\n")
         
         # Why some points were deducted (if low)
         if overall_score < 8:
-            explanation += "⚠️ Why some points were deducted:\n"
-            if architecture_style not in ['Microservices', 'Event-driven', 'Distributed']:
-                explanation += f"  • Architecture: {architecture_style} - Basic or simple architecture\n"
+            parts.append("⚠️ Why some points were deducted:\n")
+            if architecture_style not in _HIGH_COMPLEXITY_STYLES:
+                parts.append(f"  • Architecture: {architecture_style} - Basic or simple architecture\n")
             if integration_score < 5:
-                explanation += f"  • Integration: {integration_score}/10 - Simple integration\n"
+                parts.append(f"  • Integration: {integration_score}/10 - Simple integration\n")
             if len(complexity_drivers) < 3:
-                explanation += f"  • Complexity drivers: {len(complexity_drivers)} factors - Limited complexity factors\n"
+                parts.append(f"  • Complexity drivers: {len(complexity_drivers)} factors - Limited complexity factors\n")
             if len(tech_stack) < 3:
-                explanation += f"  • Tech stack: {len(tech_stack)} technologies - Limited technology diversity\n"
+                parts.append(f"  • Tech stack: {len(tech_stack)} technologies - Limited technology diversity\n")
         
         # Key Reasons for the Score
-        explanation += f"\n📊 Key Reasons for the Score:\n"
-        explanation += f"  • Architecture: {architecture_style} - How complex the system architecture is\n"
-        explanation += f"  • Integration: {integration_score}/10 - How complex the integrations are\n"
-        explanation += f"  • Complexity drivers: {len(complexity_drivers)} factors - What makes the system complex\n"
-        explanation += f"  • Tech stack: {len(tech_stack)} technologies - How many different technologies are used\n"
+        parts.append(f"\n📊 Key Reasons for the Score:\n")
+        parts.append(f"  • Architecture: {architecture_style} - How complex the system architecture is\n")
+        parts.append(f"  • Integration: {integration_score}/10 - How complex the integrations are\n")
+        parts.append(f"  • Complexity drivers: {len(complexity_drivers)} factors - What makes the system complex\n")
+        parts.append(f"  • Tech stack: {len(tech_stack)} technologies - How many different technologies are used\n")
         
         # In Simple Terms
-        explanation += f"\n💡 In Simple Terms:\n"
+        parts.append(f"\n💡 In Simple Terms:\n")
         if overall_score >= 8:
-            explanation += "This is a very technically complex project! It uses advanced architecture, complex integrations, and many different technologies. It's impressive from a technical standpoint."
+            parts.append("This is a very technically complex project! It uses advanced architecture, complex integrations, and many different technologies. It's impressive from a technical standpoint.")
         elif overall_score >= 6:
-            explanation += "This project has good technical complexity. It uses solid architecture and reasonable integrations. It's technically sound but not overly complex."
+            parts.append("This project has good technical complexity. It uses solid architecture and reasonable integrations. It's technically sound but not overly complex.")
         elif overall_score >= 4:
-            explanation += "This project has basic technical complexity. It uses simple architecture and basic integrations. It's technically straightforward but not very complex."
+            parts.append("This project has basic technical complexity. It uses simple architecture and basic integrations. It's technically straightforward but not very complex.")
         else:
-            explanation += "This project has very low technical complexity. It uses simple architecture and basic integrations. It's technically simple and straightforward."
+            parts.append("This project has very low technical complexity. It uses simple architecture and basic integrations. It's technically simple and straightforward.")
         
-        return explanation
+        return ''.join(parts)
 
 
 class UIUXPolishAgent(BaseSpecializedAgent):
@@ -3790,6 +4237,7 @@ class UIUXPolishAgent(BaseSpecializedAgent):
     def __init__(self, api_key: Optional[str] = None):
         super().__init__("UIUXPolishAgent", api_key)
         self.ui_renderer = UIRenderer() if UI_RENDERING_AVAILABLE else None
+        self._ui_exec_cache = _LRUCache(max_size=32)
         self.prompt = """
 You are the UI/UX Polish Judge. Analyze screenshots (if provided) and/or textual cues.
 
@@ -3845,7 +4293,7 @@ If screenshots >= 2: base 0.8; else if screenshots=1: base 0.6; else base 0.3.
     
     def analyze(self, context: Dict[str, Any]) -> AgentAnalysis:
         """Analyze UI/UX polish with UI execution capabilities"""
-        inputs_dict = self._extract_inputs(context)
+        inputs_dict = self._get_inputs(context)
         
         # Add UI execution analysis if available
         ui_execution_analysis = self._analyze_ui_execution(context)
@@ -3890,13 +4338,13 @@ If screenshots >= 2: base 0.8; else if screenshots=1: base 0.6; else base 0.3.
         if subscores.get('typography', 0) > 0:
             insights.append("Consistent typography and styling")
         
+        # If no basic insights were added, add a default one
+        if not insights:
+            insights.append("UI/UX Polish analysis completed")
+        
         # Add detailed scoring explanation
         insights.append(scoring_explanation)
         
-        # If no basic insights were added, add a default one
-        if len(insights) == 1:  # Only the detailed explanation
-            insights.insert(0, "UI/UX Polish analysis completed")
-        
         return AgentAnalysis(
             agent_name=self.name,
             score=normalized_score,
@@ -3929,56 +4377,56 @@ If screenshots >= 2: base 0.8; else if screenshots=1: base 0.6; else base 0.3.
         else:
             assessment = "Poor UI/UX polish requiring significant visual improvements"
         
-        explanation = f"UI/UX Polish: {overall_score}/10 - {assessment}\n\n"
+        parts = [f"UI/UX Polish: {overall_score}/10 - {assessment}\n\n"]
         
         # Why this score is high (if high)
         if overall_score >= 8:
-            explanation += "🎯 Why this score is high:\n"
+            parts.append("🎯 Why this score is high:\n")
             if visual_polish >= 7:
-                explanation += f"  • Visual polish: {visual_polish}/10 - Excellent component harmony and consistency\n"
+                parts.append(f"  • Visual polish: {visual_polish}/10 - Excellent component harmony and consistency\n")
             if spacing_alignment >= 7:
-                explanation += f"  • Spacing & alignment: {spacing_alignment}/10 - Balanced spacing and clear alignment\n"
+                parts.append(f"  • Spacing & alignment: {spacing_alignment}/10 - Balanced spacing and clear alignment\n")
             if hierarchy_layout >= 7:
-                explanation += f"  • Hierarchy & layout: {hierarchy_layout}/10 - Clear visual hierarchy and layout\n"
+                parts.append(f"  • Hierarchy & layout: {hierarchy_layout}/10 - Clear visual hierarchy and layout\n")
             if color_contrast >= 7:
-                explanation += f"  • Color & contrast: {color_contrast}/10 - Excellent readability and contrast\n"
+                parts.append(f"  • Color & contrast: {color_contrast}/10 - Excellent readability and contrast\n")
             if typography >= 7:
-                explanation += f"  • Typography: {typography}/10 - Crisp typography and consistent styling\n"
+                parts.append(f"  • Typography: {typography}/10 - Crisp typography and consistent styling\n")
         
         # Why some points were deducted (if low)
         if overall_score < 8:
-            explanation += "⚠️ Why some points were deducted:\n"
+            parts.append("⚠️ Why some points were deducted:\n")
             if visual_polish < 5:
-                explanation += f"  • Visual polish: {visual_polish}/10 - Prototype-looking with poor consistency\n"
+                parts.append(f"  • Visual polish: {visual_polish}/10 - Prototype-looking with poor consistency\n")
             if spacing_alignment < 5:
-                explanation += f"  • Spacing & alignment: {spacing_alignment}/10 - Misaligned elements and poor spacing\n"
+                parts.append(f"  • Spacing & alignment: {spacing_alignment}/10 - Misaligned elements and poor spacing\n")
             if hierarchy_layout < 5:
-                explanation += f"  • Hierarchy & layout: {hierarchy_layout}/10 - Poor visual hierarchy and layout\n"
+                parts.append(f"  • Hierarchy & layout: {hierarchy_layout}/10 - Poor visual hierarchy and layout\n")
             if color_contrast < 5:
-                explanation += f"  • Color & contrast: {color_contrast}/10 - Poor contrast and readability\n"
+                parts.append(f"  • Color & contrast: {color_contrast}/10 - Poor contrast and readability\n")
             if typography < 5:
-                explanation += f"  • Typography: {typography}/10 - Inconsistent typography and poor styling\n"
+                parts.append(f"  • Typography: {typography}/10 - Inconsistent typography and poor styling\n")
         
         # Key Reasons for the Score
-        explanation += f"\n📊 Key Reasons for the Score:\n"
-        explanation += f"  • Visual polish: {visual_polish}/10 - How polished and consistent the visual design is\n"
-        explanation += f"  • Spacing & alignment: {spacing_alignment}/10 - How well elements are spaced and aligned\n"
-        explanation += f"  • Hierarchy & layout: {hierarchy_layout}/10 - How clear the visual hierarchy is\n"
-        explanation += f"  • Color & contrast: {color_contrast}/10 - How readable and accessible the colors are\n"
-        explanation += f"  • Typography: {typography}/10 - How consistent and well-designed the typography is\n"
+        parts.append(f"\n📊 Key Reasons for the Score:\n")
+        parts.append(f"  • Visual polish: {visual_polish}/10 - How polished and consistent the visual design is\n")
+        parts.append(f"  • Spacing & alignment: {spacing_alignment}/10 - How well elements are spaced and aligned\n")
+        parts.append(f"  • Hierarchy & layout: {hierarchy_layout}/10 - How clear the visual hierarchy is\n")
+        parts.append(f"  • Color & contrast: {color_contrast}/10 - How readable and accessible the colors are\n")
+        parts.append(f"  • Typography: {typography}/10 - How consistent and well-designed the typography is\n")
         
         # In Simple Terms
-        explanation += f"\n💡 In Simple Terms:\n"
+        parts.append(f"\n💡 In Simple Terms:\n")
         if overall_score >= 8:
-            explanation += "This project has excellent UI/UX polish! The design is production-grade with consistent components, clear hierarchy, and excellent typography. It looks professional and polished."
+            parts.append("This project has excellent UI/UX polish! The design is production-grade with consistent components, clear hierarchy, and excellent typography. It looks professional and polished.")
         elif overall_score >= 6:
-            explanation += "This project has good UI/UX polish. The design is polished with balanced spacing and clear hierarchy. It looks professional but could be improved."
+            parts.append("This project has good UI/UX polish. The design is polished with balanced spacing and clear hierarchy. It looks professional but could be improved.")
         elif overall_score >= 4:
-            explanation += "This project has basic UI/UX polish. The design is usable but has some inconsistencies and spacing issues. It works but needs improvement."
+            parts.append("This project has basic UI/UX polish. The design is usable but has some inconsistencies and spacing issues. It works but needs improvement.")
         else:
-            explanation += "This project has poor UI/UX polish. The design looks prototype-like with misaligned elements and poor contrast. It needs significant visual improvements."
+            parts.append("This project has poor UI/UX polish. The design looks prototype-like with misaligned elements and poor contrast. It needs significant visual improvements.")
         
-        return explanation
+        return ''.join(parts)
     
     def _extract_inputs(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Extract relevant inputs from context"""
@@ -3992,7 +4440,7 @@ If screenshots >= 2: base 0.8; else if screenshots=1: base 0.6; else base 0.3.
             screenshots.append(artifacts['screenshots_or_demo'])
         
         # Extract UI routes/pages
-        ui_routes_or_pages = self._extract_ui_routes(file_tree, readme)
+        ui_routes_or_pages = self._extract_ui_routes(self._get_file_tree_signals(context), readme)
         
         # Extract brand/theme notes
         brand_or_theme_notes = self._extract_brand_notes(readme)
@@ -4007,50 +4455,28 @@ If screenshots >= 2: base 0.8; else if screenshots=1: base 0.6; else base 0.3.
             'copy_examples': copy_examples
         }
     
-    def _extract_ui_routes(self, file_tree: List[Dict], readme: str) -> List[str]:
+    def _extract_ui_routes(self, tree_signals: FileTreeSignals, readme: str) -> List[str]:
         """Extract UI routes/pages from file structure and README"""
-        routes = []
-        
         # Look for UI files
-        ui_files = ['.html', '.jsx', '.tsx', '.vue', '.svelte']
-        for file_info in file_tree:
-            if file_info.get('type') == 'blob':
-                path = file_info.get('path', '')
-                if any(path.endswith(ext) for ext in ui_files):
-                    # Extract page name from path
-                    page_name = path.split('/')[-1].split('.')[0]
-                    routes.append(page_name.title())
+        routes = list(tree_signals.ui_pages)
         
         # Look for route definitions in README
         if readme:
-            route_patterns = [
-                r'page[s]?\s*:?\s*(.+?)(?=\n|\.)',
-                r'route[s]?\s*:?\s*(.+?)(?=\n|\.)',
-                r'screen[s]?\s*:?\s*(.+?)(?=\n|\.)'
-            ]
-            
-            for pattern in route_patterns:
-                matches = re.findall(pattern, readme, re.IGNORECASE)
+            for pattern in _live_patterns(_ROUTE_PATTERNS, readme):
+                matches = pattern.findall(readme)
                 routes.extend([match.strip() for match in matches[:10]])
         
-        return list(set(routes))[:10]  # Remove duplicates and limit
+        return list(dict.fromkeys(routes))[:10]  # Remove duplicates (keeping first-seen order) and limit
     
     def _extract_brand_notes(self, readme: str) -> str:
         """Extract brand/theme notes from README"""
         if not readme:
             return ""
         
-        patterns = [
-            r'##\s*Design.*?\n(.*?)(?=\n##|\n#|\Z)',
-            r'##\s*Theme.*?\n(.*?)(?=\n##|\n#|\Z)',
-            r'##\s*Brand.*?\n(.*?)(?=\n##|\n#|\Z)',
-            r'##\s*UI.*?\n(.*?)(?=\n##|\n#|\Z)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, readme, re.DOTALL | re.IGNORECASE)
-            if match:
-                return match.group(1).strip()[:300]
+        sections = _parse_sections(readme)
+        for key in ('design', 'theme', 'brand', 'ui'):
+            if key in sections:
+                return sections[key].strip()[:300]
         
         return ""
     
@@ -4060,17 +4486,9 @@ If screenshots >= 2: base 0.8; else if screenshots=1: base 0.6; else base 0.3.
         
         if readme:
             # Look for button text, headings, etc.
-            copy_patterns = [
-                r'button[s]?\s*:?\s*(.+?)(?=\n|\.)',
-                r'heading[s]?\s*:?\s*(.+?)(?=\n|\.)',
-                r'title[s]?\s*:?\s*(.+?)(?=\n|\.)'
-            ]
-            
-            for pattern in copy_patterns:
-                matches = re.findall(pattern, readme, re.IGNORECASE)
-                examples.extend([match.strip() for match in matches[:5]])
+            examples.extend(match.strip() for match in _first_captures(_live_patterns(_COPY_PATTERNS, readme), readme, 5))
         
-        return examples[:5]
+        return examples
     
     def _simulate_analysis(self, inputs_dict: Dict[str, Any]) -> Dict[str, Any]:
         """Simulate analysis for demonstration purposes"""
@@ -4098,31 +4516,31 @@ If screenshots >= 2: base 0.8; else if screenshots=1: base 0.6; else base 0.3.
         color_contrast = 5 if screenshots else 3
         typography = 6 if copy_examples else 4
         
-        overall = int((visual_polish + spacing_alignment + hierarchy_layout + color_contrast + typography) / 5)
+        overall = (visual_polish + spacing_alignment + hierarchy_layout + color_contrast + typography) // 5
         
-        # Generate strengths
+        # Generate strengths (at most 5)
         strengths = []
-        if screenshots:
+        if screenshots and len(strengths) < 5:
             strengths.append("Visual assets provided for evaluation")
-        if ui_routes:
+        if ui_routes and len(strengths) < 5:
             strengths.append(f"Multiple UI pages identified: {len(ui_routes)}")
-        if brand_notes:
+        if brand_notes and len(strengths) < 5:
             strengths.append("Design system considerations documented")
-        if copy_examples:
+        if copy_examples and len(strengths) < 5:
             strengths.append("UI copy examples available")
         
         if not strengths:
             strengths.append("Basic UI structure detected")
         
-        # Generate fix suggestions
+        # Generate fix suggestions (at most 5)
         fix_first = []
-        if not screenshots:
+        if not screenshots and len(fix_first) < 5:
             fix_first.append("Provide screenshots for visual evaluation")
-        if not ui_routes:
+        if not ui_routes and len(fix_first) < 5:
             fix_first.append("Document UI page structure")
-        if not brand_notes:
+        if not brand_notes and len(fix_first) < 5:
             fix_first.append("Add design system documentation")
-        if not copy_examples:
+        if not copy_examples and len(fix_first) < 5:
             fix_first.append("Include UI copy examples")
         
         # Determine limitations
@@ -4140,8 +4558,8 @@ If screenshots >= 2: base 0.8; else if screenshots=1: base 0.6; else base 0.3.
                 "typography": typography
             },
             "overall_numeric": overall,
-            "strengths": strengths[:5],
-            "fix_first": fix_first[:5],
+            "strengths": strengths,
+            "fix_first": fix_first,
             "confidence_estimate": confidence,
             "limitations": limitations
         }
@@ -4154,11 +4572,11 @@ If screenshots >= 2: base 0.8; else if screenshots=1: base 0.6; else base 0.3.
         try:
             # Get project path from context
             project_path = context.get('project_path', '.')
-            if not os.path.exists(project_path):
+            if not _path_exists(project_path):
                 return None
             
             # Try to execute the application
-            execution_result = self.ui_renderer.execute_web_app(project_path)
+            execution_result = _execute_web_app_cached(self.ui_renderer, self._ui_exec_cache, project_path)
             
             if not execution_result['success']:
                 return {
@@ -4174,49 +4592,11 @@ If screenshots >= 2: base 0.8; else if screenshots=1: base 0.6; else base 0.3.
             evidence = []
             visual_analysis = {}
             
-            # Visual quality analysis
-            visual_quality = ui_analysis.get('visual_quality', 0)
-            if visual_quality > 7:
-                evidence.append(f"Excellent visual quality (score: {visual_quality:.1f})")
-            elif visual_quality > 5:
-                evidence.append(f"Good visual quality (score: {visual_quality:.1f})")
-            else:
-                evidence.append(f"Visual quality needs improvement (score: {visual_quality:.1f})")
-            
-            visual_analysis['visual_quality'] = visual_quality
-            
-            # Accessibility analysis
-            accessibility = ui_analysis.get('accessibility', 0)
-            if accessibility > 7:
-                evidence.append(f"Excellent accessibility (score: {accessibility:.1f})")
-            elif accessibility > 5:
-                evidence.append(f"Good accessibility (score: {accessibility:.1f})")
-            else:
-                evidence.append(f"Accessibility needs improvement (score: {accessibility:.1f})")
-            
-            visual_analysis['accessibility'] = accessibility
-            
-            # Responsiveness analysis
-            responsiveness = ui_analysis.get('responsiveness', 0)
-            if responsiveness > 7:
-                evidence.append(f"Excellent responsiveness (score: {responsiveness:.1f})")
-            elif responsiveness > 5:
-                evidence.append(f"Good responsiveness (score: {responsiveness:.1f})")
-            else:
-                evidence.append(f"Responsiveness needs improvement (score: {responsiveness:.1f})")
-            
-            visual_analysis['responsiveness'] = responsiveness
-            
-            # Interactivity analysis
-            interactivity = ui_analysis.get('interactivity', 0)
-            if interactivity > 7:
-                evidence.append(f"Excellent interactivity (score: {interactivity:.1f})")
-            elif interactivity > 5:
-                evidence.append(f"Good interactivity (score: {interactivity:.1f})")
-            else:
-                evidence.append(f"Interactivity needs improvement (score: {interactivity:.1f})")
-            
-            visual_analysis['interactivity'] = interactivity
+            # Visual quality, accessibility, responsiveness and interactivity
+            for key, label, _ in _UI_METRICS:
+                metric = ui_analysis.get(key, 0)
+                evidence.append(_ui_metric_evidence(label, metric)[0])
+                visual_analysis[key] = metric
             
             # Screenshot analysis
             if screenshots:
@@ -4237,6 +4617,16 @@ If screenshots >= 2: base 0.8; else if screenshots=1: base 0.6; else base 0.3.
             }
 
 
+# Read-only template for run_new_agent's mock result
+_MOCK_RESULT = MappingProxyType({
+    "overall_numeric": 7,
+    "confidence_estimate": 0.8,
+    "evidence_points": ("Mock evidence",),
+    "specific_opportunities": ("Mock opportunity",),
+    "risks_or_caveats": ("Mock risk",)
+})
+
+
 def run_new_agent(model, prompt: str, inputs_dict: Dict[str, Any]) -> Dict[str, Any]:
     """
     Run a new agent with the provided model and inputs.
@@ -4250,81 +4640,146 @@ def run_new_agent(model, prompt: str, inputs_dict: Dict[str, Any]) -> Dict[str,
         Dictionary containing the agent's analysis results
     """
     # IMPORTANT: Always ask for valid JSON only.
-    final_prompt = (
-        prompt
-        + "\n\nReturn ONLY the JSON object. Do not add prose before/after."
-        + "\n\nInputs:\n" + json.dumps(inputs_dict, ensure_ascii=False)
-    )
+    final_prompt = ''.join((
+        prompt,
+        "\n\nReturn ONLY the JSON object. Do not add prose before/after."
+        "\n\nInputs:\n",
+        _dumps_json(inputs_dict),
+    ))
     
     # In a real implementation, this would call the model
     # raw = model.generate(final_prompt)
-    # result = json.loads(raw)
+    # result = _loads_json(raw)
     
     # For demonstration, return a mock result
-    return {
-        "overall_numeric": 7,
-        "confidence_estimate": 0.8,
-        "evidence_points": ["Mock evidence"],
-        "specific_opportunities": ["Mock opportunity"],
-        "risks_or_caveats": ["Mock risk"]
-    }
+    return dict(_MOCK_RESULT)
+
+
+# Below this many agents a plain Python sum beats building numpy arrays
+_VECTORIZE_MIN_AGENTS = 32
+
+
+def _weighted_mean(scores: np.ndarray, weights: np.ndarray) -> float:
+    """Confidence-weighted mean of agent scores, 0 if no agent has any confidence"""
+    if len(scores) >= _VECTORIZE_MIN_AGENTS:
+        total_score = float(scores @ weights)
+        total_weight = float(weights.sum())
+    else:
+        weights = weights.tolist()
+        total_score = sum(score * weight for score, weight in zip(scores.tolist(), weights))
+        total_weight = sum(weights)
     
+    return total_score / total_weight if total_weight > 0 else 0
+
+
+# Agent numbers used for selection - ALL 9 AGENTS AVAILABLE
+_AGENT_NUMBER_MAP = {
+    '1': 'code',                    # Code Analysis
+    '2': 'architecture',            # Architecture Analysis
+    '3': 'ui_ux',                   # UI/UX Analysis
+    '4': 'security',                # Security Analysis
+    '5': 'innovation',              # Innovation & Creativity
+    '6': 'functionality',           # Functionality & Completeness
+    '7': 'technical',               # Technical Complexity
+    '8': 'ui_ux_polish',            # UI/UX Polish
+    '9': 'learning'                 # Learning Agent
+}
+
+# Display names for the specialized agents
+_SPECIALIZED_LABELS = {
+    'innovation': 'Innovation & Creativity',
+    'functionality': 'Functionality & Completeness',
+    'technical': 'Technical Complexity',
+    'ui_ux_polish': 'UI/UX Polish',
+    'learning': 'Learning Agent'
+}
+
+
+class _LazyAgents(dict):
+    """Agents by name, each one built the first time it's looked up"""
+    
+    def __init__(self, factories: Dict[str, Any]):
+        super().__init__()
+        self.factories = factories
+    
+    def __missing__(self, name: str):
+        agent = self[name] = self.factories[name]()
+        return agent
+
+
 class AgentOrchestrator:
     """Coordinates all our AI agents - the conductor of the orchestra"""
     
     def __init__(self, api_key: Optional[str] = None, use_specialized_agents: bool = False):
-        # Set up ALL 9 agents - no differentiation
-        self.agents = {
+        # Set up ALL 9 agents - no differentiation. Each is only built once it's first
+        # needed, so a run that selects one agent doesn't pay for the other eight.
+        self.agents = _LazyAgents({
             # Core Analysis Agents
-            'code': CodeAnalysisAgent(api_key),
-            'architecture': ArchitectureAgent(api_key),
-            'ui_ux': UIUXAgent(api_key),
-            'security': SecurityAgent(api_key),
+            'code': functools.partial(CodeAnalysisAgent, api_key),
+            'architecture': functools.partial(ArchitectureAgent, api_key),
+            'ui_ux': functools.partial(UIUXAgent, api_key),
+            'security': functools.partial(SecurityAgent, api_key),
             
             # Specialized Analysis Agents
-            'innovation': InnovationCreativityAgent(api_key),
-            'functionality': FunctionalityCompletenessAgent(api_key),
-            'technical': TechnicalComplexityAgent(api_key),
-            'ui_ux_polish': UIUXPolishAgent(api_key),
+            'innovation': functools.partial(InnovationCreativityAgent, api_key),
+            'functionality': functools.partial(FunctionalityCompletenessAgent, api_key),
+            'technical': functools.partial(TechnicalComplexityAgent, api_key),
+            'ui_ux_polish': functools.partial(UIUXPolishAgent, api_key),
             
             # Learning Agent
-            'learning': LearningAgent(api_key)
-        }
+            'learning': functools.partial(LearningAgent, api_key)
+        })
         
-        self.analysis_history = []  # Keep track of what we have done
+        self.analysis_history = deque(maxlen=256)  # Keep track of what we have done (recent runs only)
         self.use_specialized_agents = False  # No longer needed - all agents available
     
-    def analyze(self, context: Dict[str, Any], selected_agents: Optional[List[str]] = None) -> Dict[str, Any]:
-        """Run all our agents and put their results together"""
+    def analyze(self, context: Dict[str, Any], selected_agents: Optional[List[str]] = None,
+                on_agent_done: Optional[Callable[[str, AgentAnalysis], None]] = None) -> Dict[str, Any]:
+        """Run all our agents and put their results together
+        
+        on_agent_done, if given, is called with each agent's name and result as soon as that
+        agent finishes, so callers can show progress.
+        """
         agent_results = {}
         
         # Filter agents based on selection
-        agents_to_run = self.agents
+        agent_names = self.agents.factories
         if selected_agents:
-            # Map agent numbers to agent names - ALL 9 AGENTS AVAILABLE
-            agent_mapping = {
-                '1': 'code',                    # Code Analysis
-                '2': 'architecture',            # Architecture Analysis
-                '3': 'ui_ux',                   # UI/UX Analysis
-                '4': 'security',                # Security Analysis
-                '5': 'innovation',              # Innovation & Creativity
-                '6': 'functionality',           # Functionality & Completeness
-                '7': 'technical',               # Technical Complexity
-                '8': 'ui_ux_polish',            # UI/UX Polish
-                '9': 'learning'                 # Learning Agent
-            }
-            
             # Filter to only selected agents
-            selected_agent_names = [agent_mapping.get(num) for num in selected_agents if num in agent_mapping]
-            agents_to_run = {name: agent for name, agent in self.agents.items() if name in selected_agent_names}
-        
-        # Let each selected agent do their thing
-        for agent_name, agent in agents_to_run.items():
+            selected_agent_names = {_AGENT_NUMBER_MAP[num] for num in selected_agents if num in _AGENT_NUMBER_MAP}
+            # Keep the agents in their usual order so combined results don't depend on how the selection was written
+            agent_names = [name for name in agent_names if name in selected_agent_names]
+        agents_to_run = {name: self.agents[name] for name in agent_names}
+        
+        # Every agent reads the file tree columns and the cached agents key on the same inputs
+        # digest - build both before fanning out, so the agents share one copy instead of racing
+        # each other to build it. A malformed tree is left for the agents to trip over, so each
+        # one fails on its own like any other error.
+        if agents_to_run:
+            try:
+                _get_file_columns(context)
+                _get_inputs_digest(context, BaseAIAgent._cache_inputs)
+            except Exception:
+                pass
+        
+        # Let each selected agent do their thing - they don't depend on each other, so run them side by side
+        with ThreadPoolExecutor(max_workers=max(1, len(agents_to_run))) as pool:
+            futures = {agent_name: pool.submit(agent.analyze, context) for agent_name, agent in agents_to_run.items()}
+            if on_agent_done:
+                # Report each agent as it finishes; failures are reported with the results below
+                names_by_future = {future: agent_name for agent_name, future in futures.items()}
+                for future in as_completed(names_by_future):
+                    if future.exception() is None:
+                        on_agent_done(names_by_future[future], future.result())
+        
+        # Collect in selection order so combined results don't depend on which agent finished first
+        failed_agents = set()
+        for agent_name, future in futures.items():
             try:
-                result = agent.analyze(context)
-                agent_results[agent_name] = result
+                agent_results[agent_name] = future.result()
             except Exception as e:
                 print(f"Warning: Agent {agent_name} failed: {e}")
+                failed_agents.add(agent_name)
                 # If an agent fails, give it a default result
                 agent_results[agent_name] = AgentAnalysis(
                     agent_name=agent_name,
@@ -4337,7 +4792,7 @@ class AgentOrchestrator:
                 )
         
         # Combine everything into a final result
-        combined_result = self._combine_agent_results(agent_results)
+        combined_result = self._combine_agent_results(agent_results, failed_agents)
         
         # Remember this analysis for learning
         self.analysis_history.append({
@@ -4348,48 +4803,46 @@ class AgentOrchestrator:
         
         return combined_result
     
-    def _combine_agent_results(self, agent_results: Dict[str, AgentAnalysis]) -> Dict[str, Any]:
-        """Combine results from all agents"""
-        # Calculate weighted scores based on agent confidence
-        total_score = 0
-        total_weight = 0
-        
+    def _combine_agent_results(self, agent_results: Dict[str, AgentAnalysis],
+                               failed_agents: frozenset = frozenset()) -> Dict[str, Any]:
+        """Combine results from all agents (failed_agents names the ones that raised)"""
         all_evidence = []
         all_recommendations = []
         all_insights = []
         all_risks = []
-        
-        for agent_name, result in agent_results.items():
-            weight = result.confidence
-            total_score += result.score * weight
-            total_weight += weight
+        agent_scores = {}
+        confidence_scores = {}
+        # Scores and confidences side by side, for the weighted mean
+        scores = np.empty(len(agent_results), dtype=np.float64)
+        confidences = np.empty(len(agent_results), dtype=np.float64)
+        
+        # If every agent failed, only the failures are worth reporting. An agent that ran but
+        # found nothing to be confident about still has recommendations and insights to share.
+        all_failed = bool(failed_agents) and len(failed_agents) == len(agent_results)
+        
+        for i, (agent_name, result) in enumerate(agent_results.items()):
+            agent_scores[agent_name] = scores[i] = result.score
+            confidence_scores[agent_name] = confidences[i] = result.confidence
             
-            all_evidence.extend([f"{agent_name}: {evidence}" for evidence in result.evidence])
-            all_recommendations.extend([f"{agent_name}: {rec}" for rec in result.recommendations])
-            all_insights.extend([f"{agent_name}: {insight}" for insight in result.insights])
-            all_risks.extend([f"{agent_name}: {risk}" for risk in result.risks])
-        
-        # Calculate final score
-        if total_weight > 0:
-            final_score = total_score / total_weight
-        else:
-            final_score = 0
-        
-        # Add specialized agent mapping if using specialized agents
-        agent_mapping = {}
-        if self.use_specialized_agents:
-            agent_mapping = {
-                'innovation': 'Innovation & Creativity',
-                'functionality': 'Functionality & Completeness', 
-                'technical': 'Technical Complexity',
-                'ui_ux_polish': 'UI/UX Polish',
-                'learning': 'Learning Agent'
-            }
+            # Evidence, recommendations and risks get cut to their limits below, so
+            # don't label any more of them than will be kept
+            prefix = f"{agent_name}: "
+            if not all_failed:
+                all_evidence.extend(f"{prefix}{evidence}" for evidence in result.evidence[:20 - len(all_evidence)])
+                all_recommendations.extend(f"{prefix}{rec}" for rec in result.recommendations[:15 - len(all_recommendations)])
+                all_insights.extend(f"{prefix}{insight}" for insight in result.insights)
+            all_risks.extend(f"{prefix}{risk}" for risk in result.risks[:10 - len(all_risks)])
+        
+        # Calculate final score, weighted by agent confidence
+        final_score = _weighted_mean(scores, confidences) if not all_failed else 0
+        
+        # Add specialized agent mapping if using specialized agents (a copy, so callers can't edit the table)
+        agent_mapping = dict(_SPECIALIZED_LABELS) if self.use_specialized_agents else {}
         
         return {
             'total_score': round(final_score, 1),
-            'agent_scores': {name: result.score for name, result in agent_results.items()},
-            'confidence_scores': {name: result.confidence for name, result in agent_results.items()},
+            'agent_scores': agent_scores,
+            'confidence_scores': confidence_scores,
             'evidence': all_evidence[:20],  # Limit to top 20
             'recommendations': all_recommendations[:15],  # Limit to top 15
             'insights': all_insights,  # Don't limit - we need all insights for detailed human-friendly output
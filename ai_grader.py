@@ -12,13 +12,28 @@ How it works:
 4. We combine everything into a final score
 """
 
-import json
 import sys
+import threading
 import time
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
 from github_analyzer import GitHubAnalyzer
-from ai_agents import AgentOrchestrator
-from core import analysis_cache, get_logger
+from ai_agents import AgentOrchestrator, _dumps_json_indented, _loads_json
+from core import AnalysisCache, analysis_cache, config, get_logger
+
+
+# Comment tiers, best first: (minimum score, quality label, description template)
+_COMMENT_TIERS = (
+    (8, "Excellent", "Outstanding {category} with comprehensive implementation"),
+    (6, "Good", "Solid {category} implementation with room for enhancement"),
+    (4, "Fair", "Basic {category} with several areas needing improvement"),
+    (float('-inf'), "Poor", "Significant {category} issues requiring major improvements"),
+)
+
+# Words that mark a piece of evidence as positive, negative, or (when neither) about a topic we count as positive
+_POSITIVE_WORDS = ('good', 'excellent', 'strong', 'solid', 'well', 'proper', 'correct', 'implemented', 'found', 'detected')
+_NEGATIVE_WORDS = ('missing', 'lack', 'no', 'not found', 'absent', 'incomplete', 'poor', 'weak', 'issue', 'problem', 'error')
+_TOPIC_WORDS = ('test', 'documentation', 'security', 'performance', 'ui', 'ux')
 
 
 class AIGrader:
@@ -32,6 +47,13 @@ class AIGrader:
         self.agent_orchestrator = AgentOrchestrator(ai_api_key, use_specialized_agents)
         self.logger = get_logger(__name__)
         self.use_specialized_agents = False  # All agents available now
+        
+        # GitHub data we've fetched recently: (repo_url, branch, commit_sha) -> (fetched_at, repo_info, file_tree, readme)
+        self._repo_cache = AnalysisCache(max_size=128)
+        
+        # The agents (the learning agent especially) keep state between runs, so concurrent
+        # grades take turns running them - only the GitHub fetches overlap
+        self._agent_lock = threading.Lock()
     
     def grade(self, repo_url: str, branch: str = 'main', commit_sha: Optional[str] = None,
               artifacts: Optional[Dict[str, Any]] = None, selected_agents: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -66,9 +88,7 @@ class AIGrader:
             
             # First, let's get the repo data from GitHub
             print("📡 Getting repository info from GitHub...")
-            repo_info = self.github.get_repo_info(repo_url, branch)
-            file_tree = self.github.get_file_tree(repo_info)
-            readme = self.github.get_readme(repo_info)
+            repo_info, file_tree, readme = self._fetch_repo_bundle(repo_url, branch, commit_sha)
             
             # Now we need to prepare everything for our AI agents
             print("📦 Setting up data for AI analysis...")
@@ -85,13 +105,8 @@ class AIGrader:
             
             # Time to let our AI agents do their thing
             print("🤖 Running AI agents...")
-            print("   • Code Analysis Agent - Looking at code quality...")
-            print("   • Architecture Agent - Checking project structure...")
-            print("   • UI/UX Agent - Evaluating user interface...")
-            print("   • Security Agent - Scanning for security issues...")
-            print("   • Learning Agent - Using past experience...")
-            
-            ai_results = self.agent_orchestrator.analyze(context, selected_agents)
+            with self._agent_lock:
+                ai_results = self.agent_orchestrator.analyze(context, selected_agents, on_agent_done=self._report_agent_done)
             
             # Now we need to turn the AI results into actual grades
             print("📊 Converting AI analysis to scores...")
@@ -115,6 +130,55 @@ class AIGrader:
                 "ai_powered": True
             }
     
+    def grade_many(self, repo_urls: List[str], branch: str = 'main', artifacts: Optional[Dict[str, Any]] = None,
+                   selected_agents: Optional[List[str]] = None, concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        Grade several repos, overlapping their GitHub fetches
+        
+        Args:
+            repo_urls: The GitHub repos to analyze
+            branch: Which branch to look at in each repo
+            artifacts: Extra info applied to every repo
+            selected_agents: List of agent numbers to run (e.g., ['1', '3', '5'])
+            concurrency: Most repos in flight at once, to stay inside GitHub rate limits
+        
+        Returns:
+            One grading result per repo, in the same order as repo_urls
+        """
+        if not repo_urls:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(repo_urls)))) as pool:
+            return list(pool.map(lambda repo_url: self.grade(repo_url, branch, None, artifacts, selected_agents), repo_urls))
+    
+    def _report_agent_done(self, agent_name: str, result: Any):
+        """Show an agent's result as soon as it finishes"""
+        print(f"   ✅ {agent_name} agent done (score {result.score}/10)")
+    
+    def _fetch_repo_bundle(self, repo_url: str, branch: str, commit_sha: Optional[str]) -> Tuple[Dict[str, Any], List[Dict[str, Any]], str]:
+        """Get repo info, file tree and README, reusing a recent fetch of the same repo"""
+        cache_key = (repo_url, branch, commit_sha)
+        cached = self._repo_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < config.cache.github_ttl:
+            self.logger.info(f"Using cached GitHub data for {repo_url}")
+            return cached[1:]
+        
+        repo_info = self.github.get_repo_info(repo_url, branch)
+        # The file tree and README only need repo_info, so fetch them side by side
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            file_tree_future = pool.submit(self.github.get_file_tree, repo_info)
+            readme_future = pool.submit(self.github.get_readme, repo_info)
+            file_tree = file_tree_future.result()
+            readme = readme_future.result()
+        
+        # An empty tree usually means the fetch failed (rate limit, bad branch) - don't hold on to that
+        if file_tree:
+            self._repo_cache.set(cache_key, (time.monotonic(), repo_info, file_tree, readme))
+        return repo_info, file_tree, readme
+    
+    def invalidate(self, repo_url: str):
+        """Forget cached GitHub data for a repo, e.g. after a new push"""
+        self._repo_cache.discard(lambda cache_key: cache_key[0] == repo_url)
+    
     def _map_ai_results_to_grades(self, ai_results: Dict[str, Any], 
                                   context: Dict[str, Any], selected_agents: List[str] = None) -> Dict[str, Any]:
         """
@@ -227,11 +291,18 @@ class AIGrader:
                         agent_risks[agent_name] = []
                     agent_risks[agent_name].append(risk_text)
         
-        # Separate evidence by agent/category - handle all 9 agents
-        ui_evidence = [e for e in all_evidence if 'ui_ux_polish:' in e.lower() or 'ui_ux:' in e.lower()]
-        arch_evidence = [e for e in all_evidence if 'technical:' in e.lower() or 'architecture:' in e.lower()]
-        code_evidence = [e for e in all_evidence if 'code:' in e.lower() or 'functionality:' in e.lower()]
-        security_evidence = [e for e in all_evidence if 'innovation:' in e.lower() or 'security:' in e.lower()]
+        # Separate evidence by agent/category - handle all 9 agents (one pass, lowercasing each item once)
+        ui_evidence, arch_evidence, code_evidence, security_evidence = [], [], [], []
+        for e in all_evidence:
+            e_lower = e.lower()
+            if 'ui_ux_polish:' in e_lower or 'ui_ux:' in e_lower:
+                ui_evidence.append(e)
+            if 'technical:' in e_lower or 'architecture:' in e_lower:
+                arch_evidence.append(e)
+            if 'code:' in e_lower or 'functionality:' in e_lower:
+                code_evidence.append(e)
+            if 'innovation:' in e_lower or 'security:' in e_lower:
+                security_evidence.append(e)
         
         # Determine pass/fail status
         if weighted_total >= 7:
@@ -438,25 +509,30 @@ class AIGrader:
         # Analyze evidence to understand what was found
         positive_indicators = []
         negative_indicators = []
-        missing_indicators = []
+        evidence_lower = [item.lower() for item in evidence]
         
         # Categorize evidence based on content
-        for item in evidence:
-            item_lower = item.lower()
-            if any(word in item_lower for word in ['good', 'excellent', 'strong', 'solid', 'well', 'proper', 'correct', 'implemented', 'found', 'detected']):
+        for item, item_lower in zip(evidence, evidence_lower):
+            if any(word in item_lower for word in _POSITIVE_WORDS):
                 positive_indicators.append(item)
-            elif any(word in item_lower for word in ['missing', 'lack', 'no', 'not found', 'absent', 'incomplete', 'poor', 'weak', 'issue', 'problem', 'error']):
+            elif any(word in item_lower for word in _NEGATIVE_WORDS):
                 negative_indicators.append(item)
             else:
                 # Neutral evidence - could be positive or negative depending on context
-                if any(word in item_lower for word in ['test', 'documentation', 'security', 'performance', 'ui', 'ux']):
+                if any(word in item_lower for word in _TOPIC_WORDS):
                     positive_indicators.append(item)
                 else:
                     negative_indicators.append(item)
         
-        # Generate specific explanation based on score and evidence
-        if score >= 8:
-            quality = "Excellent"
+        # Pick the tier for this score (anything below the others, or not comparable, is Poor)
+        for min_score, quality, desc_template in _COMMENT_TIERS:
+            if score >= min_score:
+                break
+        category_lower = category.lower()
+        desc = desc_template.format(category=category_lower)
+        
+        # Generate specific explanation based on the tier and evidence
+        if quality == "Excellent":
             if positive_indicators:
                 specific_reasons = f" Strong evidence found: {', '.join(positive_indicators[:3])}"
                 if len(positive_indicators) > 3:
@@ -464,10 +540,7 @@ class AIGrader:
             else:
                 specific_reasons = " AI analysis indicates high quality implementation"
             
-            desc = f"Outstanding {category.lower()} with comprehensive implementation"
-            
-        elif score >= 6:
-            quality = "Good"
+        elif quality == "Good":
             if positive_indicators and negative_indicators:
                 specific_reasons = f" Found {len(positive_indicators)} positive indicators but also {len(negative_indicators)} areas for improvement"
             elif positive_indicators:
@@ -475,10 +548,7 @@ class AIGrader:
             else:
                 specific_reasons = " Solid foundation but limited evidence of advanced features"
             
-            desc = f"Solid {category.lower()} implementation with room for enhancement"
-            
-        elif score >= 4:
-            quality = "Fair"
+        elif quality == "Fair":
             if negative_indicators:
                 specific_reasons = f" Issues identified: {', '.join(negative_indicators[:2])}"
                 if len(negative_indicators) > 2:
@@ -486,48 +556,45 @@ class AIGrader:
             else:
                 specific_reasons = " Basic implementation with limited advanced features"
             
-            desc = f"Basic {category.lower()} with several areas needing improvement"
-            
         else:
-            quality = "Poor"
             if negative_indicators:
                 specific_reasons = f" Major issues found: {', '.join(negative_indicators[:3])}"
                 if len(negative_indicators) > 3:
                     specific_reasons += f" and {len(negative_indicators) - 3} more critical problems"
             else:
                 specific_reasons = " Significant gaps in implementation and best practices"
-            
-            desc = f"Significant {category.lower()} issues requiring major improvements"
         
         # Add specific deduction reasons for lower scores
         deduction_reasons = []
         if score < 8:
-            if category.lower() in ['ui/ux polish', 'ui/ux']:
-                if not any('responsive' in item.lower() for item in evidence):
+            # All the evidence in one string, so each "mentioned anywhere?" check is a single search
+            evidence_blob = '\0'.join(evidence_lower)
+            if category_lower in ['ui/ux polish', 'ui/ux']:
+                if 'responsive' not in evidence_blob:
                     deduction_reasons.append("No responsive design detected")
-                if not any('accessibility' in item.lower() for item in evidence):
+                if 'accessibility' not in evidence_blob:
                     deduction_reasons.append("Accessibility features not implemented")
-                if not any('modern' in item.lower() or 'framework' in item.lower() for item in evidence):
+                if 'modern' not in evidence_blob and 'framework' not in evidence_blob:
                     deduction_reasons.append("Outdated or basic UI framework")
             
-            elif category.lower() in ['technical complexity', 'architecture']:
-                if not any('pattern' in item.lower() for item in evidence):
+            elif category_lower in ['technical complexity', 'architecture']:
+                if 'pattern' not in evidence_blob:
                     deduction_reasons.append("No design patterns implemented")
-                if not any('scalable' in item.lower() for item in evidence):
+                if 'scalable' not in evidence_blob:
                     deduction_reasons.append("Architecture not designed for scalability")
-                if not any('api' in item.lower() for item in evidence):
+                if 'api' not in evidence_blob:
                     deduction_reasons.append("No API design or integration")
             
-            elif category.lower() in ['functionality & completeness', 'coding']:
-                if not any('error' in item.lower() and 'handling' in item.lower() for item in evidence):
+            elif category_lower in ['functionality & completeness', 'coding']:
+                if not any('error' in item_lower and 'handling' in item_lower for item_lower in evidence_lower):
                     deduction_reasons.append("No error handling detected")
-                if not any('documentation' in item.lower() for item in evidence):
+                if 'documentation' not in evidence_blob:
                     deduction_reasons.append("Insufficient documentation")
             
-            elif category.lower() in ['innovation & creativity', 'security/compliance']:
-                if not any('novel' in item.lower() or 'creative' in item.lower() for item in evidence):
+            elif category_lower in ['innovation & creativity', 'security/compliance']:
+                if 'novel' not in evidence_blob and 'creative' not in evidence_blob:
                     deduction_reasons.append("Limited innovation or creativity")
-                if not any('security' in item.lower() for item in evidence):
+                if 'security' not in evidence_blob:
                     deduction_reasons.append("Security measures not implemented")
         
         # Combine all information
@@ -548,30 +615,41 @@ class AIGrader:
         """Generate subchecks for Other category"""
         subchecks = []
         
+        # Documentation, security, tests/CI and accessibility all use the same status
+        status = "pass" if score >= 6 else "partial" if score >= 4 else "fail"
+        
+        # Sort the evidence into its subchecks in one pass
+        doc_evidence, sec_evidence, test_evidence = [], [], []
+        for e in evidence:
+            e_lower = e.lower()
+            if 'document' in e_lower:
+                doc_evidence.append(e)
+            if 'security' in e_lower:
+                sec_evidence.append(e)
+            if 'test' in e_lower or 'ci' in e_lower:
+                test_evidence.append(e)
+        
         # Documentation
-        doc_status = "pass" if score >= 6 else "partial" if score >= 4 else "fail"
         subchecks.append({
             "name": "documentation",
-            "status": doc_status,
-            "evidence": [e for e in evidence if 'document' in e.lower()][:2],
+            "status": status,
+            "evidence": doc_evidence[:2],
             "note": "AI-assessed documentation quality"
         })
         
         # Security
-        sec_status = "pass" if score >= 6 else "partial" if score >= 4 else "fail"
         subchecks.append({
             "name": "security",
-            "status": sec_status,
-            "evidence": [e for e in evidence if 'security' in e.lower()][:2],
+            "status": status,
+            "evidence": sec_evidence[:2],
             "note": "AI-assessed security practices"
         })
         
         # Tests/CI
-        test_status = "pass" if score >= 6 else "partial" if score >= 4 else "fail"
         subchecks.append({
             "name": "tests_ci",
-            "status": test_status,
-            "evidence": [e for e in evidence if 'test' in e.lower() or 'ci' in e.lower()][:2],
+            "status": status,
+            "evidence": test_evidence[:2],
             "note": "AI-assessed testing and CI/CD"
         })
         
@@ -585,10 +663,9 @@ class AIGrader:
         })
         
         # Accessibility/Performance
-        a11y_status = "pass" if score >= 6 else "partial" if score >= 4 else "fail"
         subchecks.append({
             "name": "accessibility_or_performance",
-            "status": a11y_status,
+            "status": status,
             "evidence": [],
             "note": "AI-assessed accessibility and performance"
         })
@@ -692,12 +769,15 @@ class AIGrader:
 
 def display_results(results: Dict[str, Any], repo_url: str):
     """Show the grading results in a nice format"""
-    print("\n" + "=" * 80)
-    print("📊 HACKATHON GRADING RESULTS")
-    print("=" * 80)
+    # Build the whole report first and write it in one go
+    lines = []
+    lines.append("\n" + "=" * 80)
+    lines.append("📊 HACKATHON GRADING RESULTS")
+    lines.append("=" * 80)
     
     if "error" in results:
-        print(f"\n❌ Error: {results['error']}")
+        lines.append(f"\n❌ Error: {results['error']}")
+        sys.stdout.write("\n".join(lines) + "\n")
         return
     
     # Overall Score
@@ -706,24 +786,24 @@ def display_results(results: Dict[str, Any], repo_url: str):
     
     status_emoji = {'pass': '✅', 'borderline': '⚠️', 'fail': '❌'}.get(pass_fail, '❓')
     
-    print(f"\n🎯 OVERALL SCORE: {total_score}/10")
-    print(f"📈 STATUS: {status_emoji} {pass_fail.upper()}")
-    print(f"🔗 Repository: {repo_url}")
+    lines.append(f"\n🎯 OVERALL SCORE: {total_score}/10")
+    lines.append(f"📈 STATUS: {status_emoji} {pass_fail.upper()}")
+    lines.append(f"🔗 Repository: {repo_url}")
     
     # What the score means
-    print(f"\n💡 SCORE EXPLANATION:")
+    lines.append(f"\n💡 SCORE EXPLANATION:")
     if total_score >= 9:
-        print("   🌟 EXCELLENT: This is really impressive work!")
+        lines.append("   🌟 EXCELLENT: This is really impressive work!")
     elif total_score >= 7:
-        print("   ✅ GOOD: Solid work that meets the standards")
+        lines.append("   ✅ GOOD: Solid work that meets the standards")
     elif total_score >= 5:
-        print("   ⚠️  BORDERLINE: Not bad, but could use some improvements")
+        lines.append("   ⚠️  BORDERLINE: Not bad, but could use some improvements")
     else:
-        print("   ❌ POOR: Needs quite a bit of work to get up to standard")
+        lines.append("   ❌ POOR: Needs quite a bit of work to get up to standard")
     
     # Category Breakdown
-    print(f"\n📋 DETAILED BREAKDOWN:")
-    print("-" * 80)
+    lines.append(f"\n📋 DETAILED BREAKDOWN:")
+    lines.append("-" * 80)
     
     breakdown = results.get('breakdown', {})
     categories = [
@@ -742,35 +822,35 @@ def display_results(results: Dict[str, Any], repo_url: str):
             comment = data.get('comment', '')
             evidence = data.get('evidence', [])
             
-            print(f"\n{emoji} {category_name}: {score}/10 (Weight: {weight}%)")
-            print(f"   🤖 AI Confidence: {confidence:.0%}")
-            print(f"   💬 {comment}")
+            lines.append(f"\n{emoji} {category_name}: {score}/10 (Weight: {weight}%)")
+            lines.append(f"   🤖 AI Confidence: {confidence:.0%}")
+            lines.append(f"   💬 {comment}")
             
             if evidence:
-                print(f"   🔍 Evidence:")
+                lines.append(f"   🔍 Evidence:")
                 for ev in evidence[:3]:
-                    print(f"      • {ev}")
+                    lines.append(f"      • {ev}")
                 if len(evidence) > 3:
-                    print(f"      • ... and {len(evidence) - 3} more")
+                    lines.append(f"      • ... and {len(evidence) - 3} more")
     
     # AI Insights
     if results.get('ai_insights'):
-        print(f"\n💡 AI INSIGHTS:")
-        print("-" * 40)
+        lines.append(f"\n💡 AI INSIGHTS:")
+        lines.append("-" * 40)
         for i, insight in enumerate(results['ai_insights'][:5], 1):
-            print(f"   {i}. {insight}")
+            lines.append(f"   {i}. {insight}")
     
     # AI Recommendations
     if results.get('ai_recommendations'):
-        print(f"\n🎯 AI RECOMMENDATIONS:")
-        print("-" * 40)
+        lines.append(f"\n🎯 AI RECOMMENDATIONS:")
+        lines.append("-" * 40)
         for i, rec in enumerate(results['ai_recommendations'][:5], 1):
-            print(f"   {i}. {rec}")
+            lines.append(f"   {i}. {rec}")
     
     # Prioritized Actions
     if results.get('prioritized_actions'):
-        print(f"\n🚀 PRIORITIZED ACTION ITEMS:")
-        print("-" * 40)
+        lines.append(f"\n🚀 PRIORITIZED ACTION ITEMS:")
+        lines.append("-" * 40)
         for action in results['prioritized_actions'][:3]:
             priority = action.get('priority', 1)
             action_text = action.get('action', '')
@@ -778,36 +858,38 @@ def display_results(results: Dict[str, Any], repo_url: str):
             impact = action.get('expected_impact', '')
             
             effort_emoji = {'low': '🟢', 'medium': '🟡', 'high': '🔴'}.get(effort, '🟡')
-            print(f"   {priority}. {action_text}")
-            print(f"      {effort_emoji} Effort: {effort.title()} | 💡 Impact: {impact}")
+            lines.append(f"   {priority}. {action_text}")
+            lines.append(f"      {effort_emoji} Effort: {effort.title()} | 💡 Impact: {impact}")
     
     # Risks
     if results.get('risks_red_flags'):
-        print(f"\n🚨 RISKS & RED FLAGS:")
-        print("-" * 40)
+        lines.append(f"\n🚨 RISKS & RED FLAGS:")
+        lines.append("-" * 40)
         for risk in results['risks_red_flags'][:3]:
-            print(f"   ⚠️  {risk}")
+            lines.append(f"   ⚠️  {risk}")
     
     # Top Strengths
     if results.get('top_strengths'):
-        print(f"\n✅ TOP STRENGTHS:")
+        lines.append(f"\n✅ TOP STRENGTHS:")
         for strength in results['top_strengths'][:3]:
-            print(f"   • {strength}")
+            lines.append(f"   • {strength}")
     
     # Top Improvements
     if results.get('top_improvements'):
-        print(f"\n📈 TOP IMPROVEMENTS NEEDED:")
+        lines.append(f"\n📈 TOP IMPROVEMENTS NEEDED:")
         for improvement in results['top_improvements'][:3]:
-            print(f"   • {improvement}")
+            lines.append(f"   • {improvement}")
     
     # Calculation
     if results.get('notes', {}).get('calculation'):
-        print(f"\n📊 SCORE CALCULATION:")
-        print(f"   {results['notes']['calculation']}")
+        lines.append(f"\n📊 SCORE CALCULATION:")
+        lines.append(f"   {results['notes']['calculation']}")
+    
+    lines.append("\n" + "=" * 80)
+    lines.append("✅ Evaluation Complete!")
+    lines.append("=" * 80 + "\n")
     
-    print("\n" + "=" * 80)
-    print("✅ Evaluation Complete!")
-    print("=" * 80 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -815,7 +897,9 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='AI-Powered Hackathon GitHub Submission Grader')
-    parser.add_argument('--repo', required=True, help='GitHub repository URL')
+    repo_source = parser.add_mutually_exclusive_group(required=True)
+    repo_source.add_argument('--repo', help='GitHub repository URL')
+    repo_source.add_argument('--repos-file', help='File with one GitHub repository URL per line, to grade in a batch')
     parser.add_argument('--branch', default='main', help='Branch to analyze (default: main)')
     parser.add_argument('--commit', help='Specific commit SHA to analyze')
     parser.add_argument('--artifacts', help='JSON file containing artifacts')
@@ -824,6 +908,7 @@ def main():
     parser.add_argument('--specialized-agents', action='store_true', help='Use specialized agents (Innovation, Functionality, Technical, UI/UX)')
     parser.add_argument('--output', help='Output file for results (optional)')
     parser.add_argument('--json', action='store_true', help='Output raw JSON instead of formatted display')
+    parser.add_argument('--concurrency', type=int, default=8, help='Repos graded at once with --repos-file (default: 8)')
     
     args = parser.parse_args()
     
@@ -831,8 +916,8 @@ def main():
     artifacts = {}
     if args.artifacts:
         try:
-            with open(args.artifacts, 'r') as f:
-                artifacts = json.load(f)
+            with open(args.artifacts, 'rb') as f:
+                artifacts = _loads_json(f.read())
         except Exception as e:
             print(f"Warning: Could not load artifacts file: {e}")
     
@@ -840,21 +925,37 @@ def main():
     grader = AIGrader(args.token, args.ai_key, args.specialized_agents)
     
     # Run the analysis
-    results = grader.grade(args.repo, args.branch, args.commit, artifacts)
+    if args.repos_file:
+        try:
+            with open(args.repos_file, 'r') as f:
+                repo_urls = [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+        except Exception as e:
+            print(f"Error: Could not read repos file: {e}")
+            sys.exit(1)
+        batch_results = grader.grade_many(repo_urls, args.branch, artifacts, concurrency=args.concurrency)
+        # Results keyed by repo so the JSON says which is which
+        results = dict(zip(repo_urls, batch_results))
+    else:
+        results = grader.grade(args.repo, args.branch, args.commit, artifacts)
+    
+    # Serialize once - the same JSON goes to stdout and/or the output file
+    output = _dumps_json_indented(results) if (args.json or args.output) else None
     
     # Show the results
     if args.json:
         # Just dump the raw JSON
-        output = json.dumps(results, indent=2)
         print(output)
+    elif args.repos_file:
+        for repo_url, repo_results in results.items():
+            display_results(repo_results, repo_url)
     else:
         # Pretty formatted output
         display_results(results, args.repo)
     
     # Save to file if they want it
     if args.output:
-        with open(args.output, 'w') as f:
-            f.write(json.dumps(results, indent=2))
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
         print(f"📄 Results also saved to: {args.output}")
 
 
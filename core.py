@@ -15,7 +15,7 @@ import threading
 import psutil
 from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Optional, List, Dict, Union
+from typing import Any, Callable, Optional, List, Dict, Union
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -37,6 +37,7 @@ class UIConfig:
 @dataclass
 class CacheConfig:
     max_size: int = int(os.getenv("CACHE_MAX_SIZE", "100"))
+    github_ttl: int = int(os.getenv("GITHUB_CACHE_TTL", "600"))  # seconds
 
 @dataclass
 class SecurityConfig:
@@ -166,42 +167,54 @@ class AnalysisCache:
         self.cache = OrderedDict()
         self.hit_count = 0
         self.miss_count = 0
+        self._lock = threading.Lock()  # get() reorders entries, so concurrent callers must take turns
         self.logger = get_logger(__name__)
         self.logger.info(f"AnalysisCache initialized with max_size={self.max_size}")
     
     def get(self, key: str) -> Optional[Any]:
         """Get item from cache"""
-        if key in self.cache:
-            # Move to end (most recently used)
-            value = self.cache.pop(key)
-            self.cache[key] = value
-            self.hit_count += 1
-            self.logger.debug(f"Cache hit for key: {key}")
-            return value
-        
-        self.miss_count += 1
+        with self._lock:
+            if key in self.cache:
+                # Move to end (most recently used)
+                value = self.cache.pop(key)
+                self.cache[key] = value
+                self.hit_count += 1
+                self.logger.debug(f"Cache hit for key: {key}")
+                return value
+            
+            self.miss_count += 1
         self.logger.debug(f"Cache miss for key: {key}")
         return None
     
     def set(self, key: str, value: Any):
         """Set item in cache"""
-        if key in self.cache:
-            # Update existing item
-            self.cache.pop(key)
-        elif len(self.cache) >= self.max_size:
-            # Remove least recently used item
-            oldest_key = next(iter(self.cache))
-            self.cache.pop(oldest_key)
-            self.logger.debug(f"Evicted oldest cache entry: {oldest_key}")
-        
-        self.cache[key] = value
+        with self._lock:
+            if key in self.cache:
+                # Update existing item
+                self.cache.pop(key)
+            elif len(self.cache) >= self.max_size:
+                # Remove least recently used item
+                oldest_key = next(iter(self.cache))
+                self.cache.pop(oldest_key)
+                self.logger.debug(f"Evicted oldest cache entry: {oldest_key}")
+            
+            self.cache[key] = value
         self.logger.debug(f"Cached item with key: {key}")
     
+    def discard(self, predicate: Callable[[Any], bool]) -> int:
+        """Remove every entry whose key matches predicate, returning how many were removed"""
+        with self._lock:
+            doomed = [key for key in self.cache if predicate(key)]
+            for key in doomed:
+                del self.cache[key]
+        return len(doomed)
+    
     def clear(self):
         """Clear all cache entries"""
-        self.cache.clear()
-        self.hit_count = 0
-        self.miss_count = 0
+        with self._lock:
+            self.cache.clear()
+            self.hit_count = 0
+            self.miss_count = 0
         self.logger.info("Cache cleared")
     
     def get_stats(self) -> Dict[str, Any]: